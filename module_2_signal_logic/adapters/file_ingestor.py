@@ -1,10 +1,22 @@
+import asyncio
 import json
+import sys
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
+from watchfiles import awatch
+
+from module_2_signal_logic.adapters import serialization
 from module_2_signal_logic.core.models import LaneSnapshot
 
+# Coarsest mtime resolution we expect (FAT/SMB round to 2s). A same-size rewrite
+# inside one mtime tick leaves the stat key unchanged, so while the cached parse
+# is this close to the file's mtime the contents are compared as well.
+MTIME_GRANULARITY_NS = 2_000_000_000
+
 
 class ResultsFileIngestor:
     """Load lane telemetry snapshots from Module 1 results JSON file."""
@@ -13,24 +25,91 @@ class ResultsFileIngestor:
         self.source_path = source_path
         self.window_size = max(window_size, 1)
         self._metadata: Dict[str, Any] = {}
+        # bumped whenever the metadata block changes so callers can cache on it
+        self.metadata_version = 0
+        self._data_ready: Optional[asyncio.Event] = None
+        self._data_ready_loop: Optional[asyncio.AbstractEventLoop] = None
+        # last parsed window, reused until the file's (inode, mtime_ns, size)
+        # changes or, near its mtime, its bytes differ
+        self._cache_key: Optional[Tuple[int, int, int]] = None
+        self._cached_window: List[LaneSnapshot] = []
+        self._cached_raw = b""
+        self._cached_at_ns = 0
+
+    @property
+    def data_ready(self) -> asyncio.Event:
+        """Set whenever the results file changes; consumers clear it once handled.
+
+        Must be used from a running event loop. The event is created there (on
+        Python 3.9 an Event binds to the loop current at construction), and
+        again if a later loop, e.g. a fresh app lifespan, asks for it.
+        """
+        loop = asyncio.get_running_loop()
+        if self._data_ready is None or self._data_ready_loop is not loop:
+            self._data_ready = asyncio.Event()
+            self._data_ready_loop = loop
+        return self._data_ready
+
+    async def watch(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """Signal `data_ready` whenever the results file is written.
+
+        Setting `stop_event` ends the watch and its watcher thread; cancelling
+        the task alone leaves that thread running.
+        """
+        data_ready = self.data_ready
+        watch_dir = self.source_path.parent
+        watch_dir.mkdir(parents=True, exist_ok=True)
+        async for _changes in awatch(
+            watch_dir,
+            watch_filter=lambda _change, path: Path(path).name == self.source_path.name,
+            recursive=False,
+            stop_event=stop_event,
+        ):
+            data_ready.set()
 
     def load_recent(self) -> List[LaneSnapshot]:
-        if not self.source_path.exists():
-            self._metadata = {}
+        checked_at_ns = time.time_ns()
+        try:
+            stat = self.source_path.stat()
+        except OSError:
+            self._cache_key = None
+            self._set_metadata({})
             return []
+        cache_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        raw: Optional[bytes] = None
+        if cache_key == self._cache_key:
+            if self._cached_at_ns - stat.st_mtime_ns >= MTIME_GRANULARITY_NS:
+                return list(self._cached_window)
+            try:
+                raw = self.source_path.read_bytes()
+            except OSError:
+                raw = None
+            if raw == self._cached_raw:
+                self._cached_at_ns = checked_at_ns
+                return list(self._cached_window)
+        self._cache_key = None
 
         try:
-            payload = json.loads(self.source_path.read_text())
+            if raw is None:
+                raw = self.source_path.read_bytes()
+            payload = serialization.loads(raw)
         except (json.JSONDecodeError, OSError):
-            self._metadata = {}
+            self._set_metadata({})
             return []
 
         records, metadata = self._extract(payload)
-        self._metadata = metadata
-        if not records:
-            return []
-
-        snapshots: List[LaneSnapshot] = []
+        self._set_metadata(metadata)
+        window = self._build_window(records) if records else []
+        self._cache_key = cache_key
+        self._cached_window = window
+        self._cached_raw = raw
+        self._cached_at_ns = checked_at_ns
+        return list(window)
+
+    def _build_window(self, records: List[Dict[str, Any]]) -> List[LaneSnapshot]:
+        # lane state accumulates over every record, but only the last
+        # window_size records are turned into validated snapshots
+        pending: Deque[Dict[str, Any]] = deque(maxlen=self.window_size)
         current_counts: Dict[str, int] = {}
         current_totals: Dict[str, int] = {}
         current_signals: Dict[str, str] = {}
@@ -83,19 +162,25 @@ class ResultsFileIngestor:
 
             frame_id = self._coerce_optional_int(raw.get("frame_id"))
             latency = self._coerce_optional_float(raw.get("latency_ms"))
-            snapshot = LaneSnapshot(
-                frame_id=frame_id,
-                timestamp=timestamp,
-                lane_counts=dict(current_counts),
-                totals=dict(current_totals),
-                latency_ms=latency,
-                direction=direction,
-                signal_states=dict(current_signals),
-                junction_type=self._metadata.get("junction_type"),
+            pending.append(
+                {
+                    "frame_id": frame_id,
+                    "timestamp": timestamp,
+                    "lane_counts": dict(current_counts),
+                    "totals": dict(current_totals),
+                    "latency_ms": latency,
+                    "direction": direction,
+                    "signal_states": dict(current_signals),
+                    "junction_type": self._metadata.get("junction_type"),
+                }
             )
-            snapshots.append(snapshot)
 
-        return snapshots[-self.window_size :]
+        return [LaneSnapshot(**fields) for fields in pending]
+
+    def _set_metadata(self, metadata: Dict[str, Any]) -> None:
+        if metadata != self._metadata:
+            self.metadata_version += 1
+        self._metadata = metadata
 
     @staticmethod
     def _coerce_int_map(payload: object) -> dict[str, int]:
@@ -104,7 +189,7 @@ class ResultsFileIngestor:
         result: dict[str, int] = {}
         for key, value in payload.items():
             try:
-                result[str(key)] = int(value)
+                result[sys.intern(str(key))] = int(value)
             except (TypeError, ValueError):
                 continue
         return result
@@ -128,7 +213,7 @@ class ResultsFileIngestor:
         if not isinstance(value, str):
             return None
         trimmed = value.strip()
-        return trimmed.lower() if trimmed else None
+        return sys.intern(trimmed.lower()) if trimmed else None
 
     @staticmethod
     def _parse_timestamp(value: object) -> Optional[datetime]:
@@ -1,48 +1,153 @@
 import json
-from datetime import datetime
+import logging
+import os
+from collections.abc import Mapping
+from dataclasses import asdict
 from pathlib import Path
-from typing import Iterable, List
+from typing import BinaryIO, Iterable, List, Optional
 
+from module_2_signal_logic.adapters import serialization
 from module_2_signal_logic.core.models import CycleDecision
 
+logger = logging.getLogger(__name__)
+
+# The history file is kept as a JSON array with one decision per line, so new
+# entries can be written over the closing bracket instead of rewriting the file.
+_HISTORY_OPEN = b"["
+_HISTORY_CLOSE = b"\n]\n"
+
 
 class JsonPersistence:
     """Persist cycle decisions and state snapshots as JSON artifacts."""
 
-    def __init__(self, history_path: Path, state_snapshot_path: Path) -> None:
+    def __init__(
+        self,
+        history_path: Path,
+        state_snapshot_path: Path,
+        *,
+        history_fsync_every: int = 16,
+    ) -> None:
         self.history_path = history_path
         self.state_snapshot_path = state_snapshot_path
+        self.history_fsync_every = max(history_fsync_every, 1)
         self.history_path.parent.mkdir(parents=True, exist_ok=True)
         self.state_snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        self._history_file: Optional[BinaryIO] = None
+        self._unsynced_entries = 0
 
     def append_history(self, decisions: Iterable[CycleDecision]) -> None:
-        serialized: List[dict] = []
+        lines: List[bytes] = []
         for decision in decisions:
-            serialized.append(json.loads(decision.json()))
-        if not serialized:
+            lines.append(serialization.dumps(asdict(decision)))
+        if not lines:
             return
 
-        existing: List[dict] = []
+        handle = self._open_history()
+        separator = self._history_separator(handle)
+        if separator is None:
+            # another writer replaced or reshaped the file under our handle
+            self.close()
+            handle = self._open_history()
+            separator = self._history_separator(handle)
+        handle.seek(-len(_HISTORY_CLOSE), os.SEEK_END)
+        handle.write(separator)
+        handle.write(b",\n".join(lines))
+        handle.write(_HISTORY_CLOSE)
+        # flush every append so readers see it; fsync only every N entries
+        handle.flush()
+        self._unsynced_entries += len(lines)
+        if self._unsynced_entries >= self.history_fsync_every:
+            self._sync_history()
+
+    def save_state(self, state: Mapping) -> None:
+        # replace atomically so readers never see a half-written snapshot
+        tmp_path = self.state_snapshot_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(serialization.dumps(state, indent=True))
+        os.replace(tmp_path, self.state_snapshot_path)
+
+    def commit(self, decisions: Iterable[CycleDecision], state: Mapping) -> None:
+        """Record a cycle: append its decisions, then replace the state snapshot.
+
+        History is synced on the usual `history_fsync_every` batching; the
+        snapshot needs no sync of its own because it is swapped in by rename.
+        """
+        self.append_history(decisions)
+        self.save_state(state)
+
+    def clear_history(self) -> None:
+        self.close()
+        self.history_path.write_bytes(_HISTORY_OPEN + _HISTORY_CLOSE)
+
+    def close(self) -> None:
+        """Sync and release the history file handle, if open."""
+        if self._history_file is None:
+            return
+        self._sync_history()
+        self._history_file.close()
+        self._history_file = None
+
+    def _open_history(self) -> BinaryIO:
+        if self._history_file is not None:
+            return self._history_file
         if self.history_path.exists():
+            # read errors propagate: never start over a file we could not read
+            raw = self.history_path.read_bytes()
             try:
-                existing = json.loads(self.history_path.read_text())
-            except (json.JSONDecodeError, OSError):
-                existing = []
-        existing.extend(serialized)
-        self.history_path.write_text(json.dumps(existing, indent=2))
+                parsed = serialization.loads(raw) if raw.strip() else []
+            except json.JSONDecodeError:
+                parsed = None
+            if isinstance(parsed, list):
+                if not (raw.startswith(_HISTORY_OPEN) and raw.endswith(_HISTORY_CLOSE)):
+                    # first open of an older or hand-written file: rewrite it line-per-entry once
+                    self._write_history(parsed)
+            else:
+                self._quarantine_history()
+                self._write_history([])
+        else:
+            self._write_history([])
+        self._history_file = open(self.history_path, "r+b")
+        self._unsynced_entries = 0
+        return self._history_file
 
-    def save_state(self, state: dict) -> None:
-        sanitized = self._sanitize(state)
-        self.state_snapshot_path.write_text(json.dumps(sanitized, indent=2))
+    def _history_separator(self, handle: BinaryIO) -> Optional[bytes]:
+        """Return what goes before the next entry, read from the file itself.
 
-    def clear_history(self) -> None:
-        self.history_path.write_text("[]\n")
-
-    def _sanitize(self, payload: object) -> object:
-        if isinstance(payload, dict):
-            return {str(k): self._sanitize(v) for k, v in payload.items()}
-        if isinstance(payload, list):
-            return [self._sanitize(item) for item in payload]
-        if isinstance(payload, datetime):
-            return payload.isoformat()
-        return payload
+        Returns None when the handle no longer points at a well-formed history
+        at `history_path`, e.g. after another instance cleared or replaced it.
+        """
+        try:
+            if os.stat(self.history_path).st_ino != os.fstat(handle.fileno()).st_ino:
+                return None
+        except OSError:
+            return None
+        handle.seek(0, os.SEEK_END)
+        if handle.tell() < len(_HISTORY_OPEN) + len(_HISTORY_CLOSE):
+            return None
+        handle.seek(-len(_HISTORY_CLOSE) - 1, os.SEEK_END)
+        tail = handle.read(len(_HISTORY_CLOSE) + 1)
+        if tail[1:] != _HISTORY_CLOSE:
+            return None
+        return b"\n" if tail[:1] == _HISTORY_OPEN else b",\n"
+
+    def _write_history(self, entries: List[object]) -> None:
+        body = b",\n".join(serialization.dumps(item) for item in entries)
+        tmp_path = self.history_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_HISTORY_OPEN + (b"\n" + body if entries else b"") + _HISTORY_CLOSE)
+        os.replace(tmp_path, self.history_path)
+
+    def _quarantine_history(self) -> None:
+        # keep an unreadable history for inspection instead of overwriting it
+        target = self.history_path.with_name(self.history_path.name + ".corrupt")
+        suffix = 1
+        while target.exists():
+            target = self.history_path.with_name(f"{self.history_path.name}.corrupt.{suffix}")
+            suffix += 1
+        os.replace(self.history_path, target)
+        logger.warning("History file %s is not a JSON array; moved it to %s", self.history_path, target)
+
+    def _sync_history(self) -> None:
+        if self._history_file is None or not self._unsynced_entries:
+            return
+        self._history_file.flush()
+        os.fsync(self._history_file.fileno())
+        self._unsynced_entries = 0
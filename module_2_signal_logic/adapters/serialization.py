@@ -0,0 +1,35 @@
+"""JSON helpers that use orjson when it is installed and fall back to json."""
+
+import json
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Union
+
+try:  # pragma: no cover - exercised only when orjson is installed
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _default(value: object) -> object:
+    # mirror orjson's native datetime support for the stdlib fallback
+    if isinstance(value, datetime):
+        return value.isoformat()
+    # read-only views such as MappingProxyType
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload: Any, *, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(
+            payload, default=_default, option=orjson.OPT_INDENT_2 if indent else 0
+        )
+    return json.dumps(payload, indent=2 if indent else None, default=_default).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
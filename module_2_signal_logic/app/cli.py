@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import json
+from dataclasses import asdict
 from datetime import datetime, timezone
 
 from module_2_signal_logic.adapters.file_ingestor import ResultsFileIngestor
@@ -34,7 +35,11 @@ def _build_service() -> SignalService:
         gap_weight=settings.gap_weight,
         forecast_weight=settings.forecast_weight,
     )
-    persistence = JsonPersistence(settings.history_path, settings.state_snapshot_path)
+    persistence = JsonPersistence(
+        settings.history_path,
+        settings.state_snapshot_path,
+        history_fsync_every=settings.history_fsync_every,
+    )
     return SignalService(
         ingestor,
         priority_engine,
@@ -44,6 +49,7 @@ def _build_service() -> SignalService:
         telemetry_stale_after=settings.telemetry_stale_after_seconds,
         forecast_horizon=settings.forecast_horizon_seconds,
         forecast_smoothing=settings.forecast_smoothing_factor,
+        history_limit=settings.history_limit,
     )
 
 
@@ -51,7 +57,7 @@ def _dump(obj: object) -> str:
     return json.dumps(
         obj,
         indent=2,
-        default=lambda value: value.isoformat() if hasattr(value, "isoformat") else value,
+        default=lambda value: value.isoformat() if hasattr(value, "isoformat") else dict(value),
     )
 
 
@@ -94,14 +100,14 @@ def main() -> None:
     prediction = service.predict_next()
     if prediction:
         print("Next lane prediction:")
-        print(_dump(prediction.dict()))
+        print(_dump(asdict(prediction)))
     else:
         print("Next lane prediction: unavailable")
 
     history = service.history(limit=args.history_limit)
     print(f"History entries: {len(history)} (showing up to {args.history_limit})")
     for item in history:
-        print(_dump(item.dict()))
+        print(_dump(asdict(item)))
 
 
 if __name__ == "__main__":
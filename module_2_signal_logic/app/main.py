@@ -1,14 +1,19 @@
 import asyncio
 import logging
+import os
 import shutil
 import subprocess
 import sys
-import json
+import threading
 import uuid
 from datetime import datetime, timezone
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import asdict
 from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Iterable, Union
+from typing import Optional, List, Dict, Any, Tuple, Union
 
 from fastapi import (
     Depends,
@@ -22,9 +27,10 @@ from fastapi import (
     Request,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+from module_2_signal_logic.adapters import serialization
 from module_2_signal_logic.adapters.file_ingestor import ResultsFileIngestor
 from module_2_signal_logic.adapters.persistence import JsonPersistence
 from module_2_signal_logic.app.settings import AppSettings, get_settings
@@ -54,7 +60,11 @@ priority_engine = PriorityEngine(
     gap_weight=settings.gap_weight,
     forecast_weight=settings.forecast_weight,
 )
-persistence = JsonPersistence(settings.history_path, settings.state_snapshot_path)
+persistence = JsonPersistence(
+    settings.history_path,
+    settings.state_snapshot_path,
+    history_fsync_every=settings.history_fsync_every,
+)
 signal_service = SignalService(
     ingestor,
     priority_engine,
@@ -64,36 +74,62 @@ signal_service = SignalService(
     telemetry_stale_after=settings.telemetry_stale_after_seconds,
         forecast_horizon=settings.forecast_horizon_seconds,
         forecast_smoothing=settings.forecast_smoothing_factor,
+    history_limit=settings.history_limit,
 )
 
 
+WATCH_STOP_TIMEOUT_SECONDS = 2.0
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     persistence.save_state(signal_service.snapshot(datetime.now(timezone.utc)))
     cycle_task: Optional[asyncio.Task] = None
+    watch_task: Optional[asyncio.Task] = None
+    watch_stop = asyncio.Event()
     if settings.enable_background_worker:
+        watch_task = asyncio.create_task(ingestor.watch(watch_stop))
         cycle_task = asyncio.create_task(
-            _cycle_worker(settings.poll_interval_seconds, signal_service)
+            _cycle_worker(settings.poll_interval_seconds, signal_service, ingestor.data_ready)
         )
         app.state.cycle_task = cycle_task
+    flush_task = asyncio.create_task(_upload_history_flusher(UPLOAD_HISTORY_FLUSH_SECONDS))
     try:
         yield
     finally:
+        # let the watcher thread see the stop and return before anything is
+        # cancelled; a cancelled watch leaves that thread running past shutdown
+        watch_stop.set()
+        if watch_task:
+            await asyncio.wait({watch_task}, timeout=WATCH_STOP_TIMEOUT_SECONDS)
         task: Optional[asyncio.Task] = getattr(app.state, "cycle_task", cycle_task)
-        if task:
-            task.cancel()
-            with suppress(asyncio.CancelledError):
-                await task
+        for pending in (task, watch_task, flush_task):
+            if pending:
+                pending.cancel()
+                with suppress(asyncio.CancelledError):
+                    await pending
+        flush_upload_history()
+        persistence.close()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by `serialization.dumps` (orjson when installed)."""
 
+    def render(self, content: Any) -> bytes:
+        return serialization.dumps(content)
 
-app = FastAPI(title="Module 2 Signal Logic", version="0.1.0", lifespan=lifespan)
 
-OUTPUT_FRAMES_ROOT = (
-    Path(__file__).resolve().parent.parent.parent
-    / "module_1_traffic_detection"
-    / "output_frames"
+app = FastAPI(
+    title="Module 2 Signal Logic",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
+# Resolved once; the layout of the workspace does not change at runtime.
+WORKSPACE_ROOT = Path(__file__).resolve().parents[2]
+OUTPUT_FRAMES_ROOT = WORKSPACE_ROOT / "module_1_traffic_detection" / "output_frames"
+
 app.mount(
     "/media/files",
     StaticFiles(directory=OUTPUT_FRAMES_ROOT, check_dir=False),
@@ -114,7 +150,13 @@ def get_service() -> SignalService:
     return signal_service
 
 
-async def _cycle_worker(poll_seconds: float, service: SignalService) -> None:
+async def _cycle_worker(
+    poll_seconds: float,
+    service: SignalService,
+    data_ready: asyncio.Event,
+) -> None:
+    # Step as soon as new telemetry lands; poll_seconds only bounds how long an
+    # idle junction waits before the active cycle is re-evaluated.
     while True:
         now = datetime.now(timezone.utc)
         try:
@@ -130,7 +172,9 @@ async def _cycle_worker(poll_seconds: float, service: SignalService) -> None:
             logger.warning("Cycle worker waiting for telemetry: %s", exc)
         except Exception:
             logger.exception("Cycle worker encountered an unexpected error")
-        await asyncio.sleep(poll_seconds)
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(data_ready.wait(), timeout=poll_seconds)
+        data_ready.clear()
 
 
 def _maybe_step(now: datetime, service: SignalService, cfg: AppSettings) -> None:
@@ -142,24 +186,25 @@ def _maybe_step(now: datetime, service: SignalService, cfg: AppSettings) -> None
         # acceptable when telemetry is not yet available
         pass
 @app.get("/health")
-async def health() -> dict[str, str]:
-    return {"status": "ok"}
+async def health() -> FastJSONResponse:
+    return FastJSONResponse({"status": "ok"})
 
 
 @app.get("/metrics")
-async def signal_metrics(service: SignalService = Depends(get_service)) -> dict:
+async def signal_metrics(service: SignalService = Depends(get_service)) -> FastJSONResponse:
     now = datetime.now(timezone.utc)
     _maybe_step(now, service, settings)
-    return jsonable_encoder(service.metrics())
+    return FastJSONResponse(service.metrics())
 
 
 @app.get("/signal/status")
-async def signal_status(service: SignalService = Depends(get_service)) -> dict:
+async def signal_status(service: SignalService = Depends(get_service)) -> FastJSONResponse:
     now = datetime.now(timezone.utc)
     _maybe_step(now, service, settings)
-    snapshot = service.snapshot(now)
+    # the service shares its cached snapshot, so extend a copy
+    snapshot = dict(service.snapshot(now))
     snapshot["context"] = build_operational_context(snapshot)
-    return jsonable_encoder(snapshot)
+    return FastJSONResponse(snapshot)
 
 
 @app.get("/signal/next")
@@ -167,7 +212,7 @@ async def signal_next(service: SignalService = Depends(get_service)) -> dict:
     prediction = service.predict_next()
     if not prediction:
         raise HTTPException(status_code=404, detail="No prediction available")
-    return jsonable_encoder(prediction.dict())
+    return asdict(prediction)
 
 
 @app.get("/signal/history")
@@ -176,7 +221,7 @@ async def signal_history(
     service: SignalService = Depends(get_service),
 ) -> list[dict]:
     history = service.history(limit)
-    return jsonable_encoder([decision.dict() for decision in history])
+    return [asdict(decision) for decision in history]
 
 
 @app.post("/signal/reset", status_code=204)
@@ -185,45 +230,119 @@ async def signal_reset(service: SignalService = Depends(get_service)) -> None:
 
 
 # --- Upload History Persistence ---
-UPLOAD_HISTORY_FILE = Path(__file__).resolve().parent.parent.parent / "data" / "upload_history.json"
-
-def load_upload_history() -> List[Dict[str, Any]]:
-    if not UPLOAD_HISTORY_FILE.exists():
-        return []
+UPLOAD_HISTORY_FILE = WORKSPACE_ROOT / "data" / "upload_history.json"
+UPLOAD_HISTORY_FLUSH_SECONDS = 0.2
+
+# Mutations land in memory and are flushed to disk by `_upload_history_flusher`,
+# so bursts of status updates collapse into a single write. Module 1 processing
+# runs in the threadpool, hence a threading lock/event rather than asyncio ones.
+# The cache is re-read when the file changes on disk (another process or a
+# manual edit) while no in-memory changes are pending; pending changes win.
+_upload_history_lock = threading.Lock()
+_upload_history_dirty = threading.Event()
+_upload_history_cache: Optional[List[Dict[str, Any]]] = None
+_upload_history_file_key: Optional[Tuple[int, int, int]] = None
+_upload_history_version = 0
+
+
+def _read_upload_history() -> List[Dict[str, Any]]:
     try:
-        with open(UPLOAD_HISTORY_FILE, "r") as f:
-            return json.load(f)
-    except Exception:
+        return serialization.loads(UPLOAD_HISTORY_FILE.read_bytes())
+    except (OSError, ValueError):
         return []
 
+
+def _upload_history_stat_key() -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = UPLOAD_HISTORY_FILE.stat()
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _cached_upload_history() -> List[Dict[str, Any]]:
+    # callers must hold _upload_history_lock
+    global _upload_history_cache, _upload_history_file_key, _upload_history_version
+    if _upload_history_dirty.is_set() and _upload_history_cache is not None:
+        return _upload_history_cache
+    file_key = _upload_history_stat_key()
+    if _upload_history_cache is None or file_key != _upload_history_file_key:
+        if _upload_history_cache is not None:
+            _upload_history_version += 1
+        _upload_history_cache = _read_upload_history()
+        _upload_history_file_key = file_key
+    return _upload_history_cache
+
+
+def load_upload_history() -> List[Dict[str, Any]]:
+    with _upload_history_lock:
+        return list(_cached_upload_history())
+
+
 def save_upload_history(history: List[Dict[str, Any]]):
     UPLOAD_HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(UPLOAD_HISTORY_FILE, "w") as f:
-        json.dump(history, f, indent=2)
+    tmp_path = UPLOAD_HISTORY_FILE.with_suffix(".json.tmp")
+    tmp_path.write_bytes(serialization.dumps(history, indent=True))
+    os.replace(tmp_path, UPLOAD_HISTORY_FILE)
+
+
+def flush_upload_history() -> None:
+    """Write pending upload history changes to disk, if any."""
+    global _upload_history_file_key
+    with _upload_history_lock:
+        if not _upload_history_dirty.is_set():
+            return
+        save_upload_history(_cached_upload_history())
+        _upload_history_dirty.clear()
+        _upload_history_file_key = _upload_history_stat_key()
+
+
+async def _upload_history_flusher(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        if not _upload_history_dirty.is_set():
+            continue
+        try:
+            await asyncio.to_thread(flush_upload_history)
+        except OSError:
+            logger.exception("Failed to flush upload history to %s", UPLOAD_HISTORY_FILE)
+
+
+def _mark_upload_history_dirty() -> None:
+    # callers must hold _upload_history_lock
+    global _upload_history_version
+    _upload_history_version += 1
+    _upload_history_dirty.set()
+
 
 def add_upload_record(record: Dict[str, Any]):
-    history = load_upload_history()
-    history.insert(0, record) # Prepend
-    save_upload_history(history)
+    with _upload_history_lock:
+        _cached_upload_history().insert(0, record) # Prepend
+        _mark_upload_history_dirty()
 
 def update_upload_status(run_id: str, status: str, notes: str = None):
-    history = load_upload_history()
-    for record in history:
-        if record["id"] == run_id:
-            record["status"] = status
-            if notes:
-                record["notes"] = notes
-            break
-    save_upload_history(history)
+    with _upload_history_lock:
+        for record in _cached_upload_history():
+            if record["id"] == run_id:
+                record["status"] = status
+                if notes:
+                    record["notes"] = notes
+                _mark_upload_history_dirty()
+                break
 
 
 def delete_upload_records(upload_ids: List[str]) -> int:
     """Delete upload records by IDs. Returns count of deleted records."""
-    history = load_upload_history()
-    original_count = len(history)
-    filtered_history = [record for record in history if record["id"] not in upload_ids]
-    save_upload_history(filtered_history)
-    return original_count - len(filtered_history)
+    global _upload_history_cache
+    ids = set(upload_ids)
+    with _upload_history_lock:
+        history = _cached_upload_history()
+        kept = [record for record in history if record["id"] not in ids]
+        deleted_count = len(history) - len(kept)
+        if deleted_count:
+            _upload_history_cache = kept
+            _mark_upload_history_dirty()
+        return deleted_count
 
 
 def resolve_active_upload() -> Optional[Dict[str, Any]]:
@@ -236,70 +355,93 @@ def resolve_active_upload() -> Optional[Dict[str, Any]]:
     return history[0]
 
 
-def _normalize_lane_id(value: object) -> Optional[str]:
-    if isinstance(value, str):
-        candidate = value.strip()
-        if candidate:
-            return candidate
-    return None
-
-
 def _resolve_lane_sequence(
     upload_record: Optional[Dict[str, Any]],
     status_snapshot: Dict[str, Any],
     metadata: Dict[str, Any],
 ) -> List[str]:
-    ordered: List[str] = []
-    seen: set[str] = set()
-
-    def _extend(items: Union[Iterable[object], object, None]) -> None:
-        if items is None:
-            return
-        if isinstance(items, (list, tuple, set)):
-            iterable = items
-        elif isinstance(items, dict):
-            iterable = items.keys()
-        else:
-            iterable = [items]
-        for item in iterable:
-            lane_id = _normalize_lane_id(item)
-            if not lane_id or lane_id in seen:
-                continue
-            ordered.append(lane_id)
-            seen.add(lane_id)
-
     upload_directions = (
         upload_record.get("directions")
         if upload_record and isinstance(upload_record.get("directions"), (list, tuple))
         else None
     )
-    _extend(upload_directions)
-    _extend(status_snapshot.get("directions"))
-    _extend(metadata.get("directions"))
     lane_counts = status_snapshot.get("lane_counts") or status_snapshot.get("laneCounts")
-    if isinstance(lane_counts, dict):
-        _extend(lane_counts.keys())
-
-    return ordered
-
+    sources = (
+        upload_directions,
+        status_snapshot.get("directions"),
+        metadata.get("directions"),
+        lane_counts if isinstance(lane_counts, Mapping) else None,
+    )
 
-def _build_lane_metadata(direction_sequence: List[str]) -> Dict[str, Any]:
-    lane_aliases: Dict[str, str] = {}
-    lanes: List[Dict[str, Any]] = []
-    for index, lane_id in enumerate(direction_sequence):
-        alias = f"Lane {index + 1}"
-        lane_aliases[lane_id] = alias
-        lanes.append({
+    # dict keys double as an insertion-ordered set of lane ids
+    ordered: Dict[str, None] = {}
+    for items in sources:
+        if items is None:
+            continue
+        if not isinstance(items, (list, tuple, set, Mapping)):
+            items = (items,)
+        for item in items:
+            if isinstance(item, str):
+                lane_id = item.strip()
+                if lane_id:
+                    ordered.setdefault(lane_id, None)
+
+    return list(ordered)
+
+
+@lru_cache(maxsize=16)
+def _lane_metadata_entries(
+    direction_sequence: Tuple[str, ...],
+) -> Tuple[Dict[str, str], Tuple[Dict[str, Any], ...]]:
+    # cached entries are shared between callers and must not be mutated
+    lane_aliases = {lane_id: f"Lane {index + 1}" for index, lane_id in enumerate(direction_sequence)}
+    lanes = tuple(
+        {
             "id": lane_id,
-            "alias": alias,
+            "alias": lane_aliases[lane_id],
             "order": index,
-            "label": alias,
+            "label": lane_aliases[lane_id],
             "original": lane_id,
-        })
-    return {"laneAliases": lane_aliases, "lanes": lanes}
+        }
+        for index, lane_id in enumerate(direction_sequence)
+    )
+    return lane_aliases, lanes
+
+
+def _build_lane_metadata(direction_sequence: List[str]) -> Dict[str, Any]:
+    lane_aliases, lanes = _lane_metadata_entries(tuple(direction_sequence))
+    return {"laneAliases": dict(lane_aliases), "lanes": list(lanes)}
+
+
+_operational_context_cache: Dict[str, Any] = {"key": None, "value": None}
 
 
 def build_operational_context(status_snapshot: dict) -> Dict[str, Any]:
+    """Return the dashboard context, reusing the last one while its inputs are unchanged.
+
+    The returned dict may be shared between requests and must not be mutated.
+    """
+    lane_counts = status_snapshot.get("lane_counts") or status_snapshot.get("laneCounts") or {}
+    with _upload_history_lock:
+        # pick up outside writes first; the version only moves once the file is checked
+        _cached_upload_history()
+        upload_history_version = _upload_history_version
+    key = (
+        status_snapshot.get("mode"),
+        status_snapshot.get("junction_type"),
+        tuple(status_snapshot.get("directions") or ()),
+        tuple(lane_counts) if isinstance(lane_counts, Mapping) else (),
+        ingestor.metadata_version,
+        upload_history_version,
+    )
+    if _operational_context_cache["key"] == key:
+        return _operational_context_cache["value"]
+    context = _build_operational_context(status_snapshot)
+    _operational_context_cache.update(key=key, value=context)
+    return context
+
+
+def _build_operational_context(status_snapshot: dict) -> Dict[str, Any]:
     metadata = ingestor.metadata
     upload_record = resolve_active_upload()
     upload_directions: list[str] = []
@@ -393,12 +535,11 @@ def clear_output_directory(target: Path) -> None:
 
 
 def clear_module1_upload_artifacts() -> None:
-    workspace_root = Path(__file__).resolve().parent.parent.parent
     legacy_paths = [
-        workspace_root / "data" / "uploads" / "custom" / "pending",
-        workspace_root / "data" / "uploads" / "custom" / "processed",
-        workspace_root / "module_1_traffic_detection" / "data" / "uploads" / "custom" / "pending",
-        workspace_root / "module_1_traffic_detection" / "data" / "uploads" / "custom" / "processed",
+        WORKSPACE_ROOT / "data" / "uploads" / "custom" / "pending",
+        WORKSPACE_ROOT / "data" / "uploads" / "custom" / "processed",
+        WORKSPACE_ROOT / "module_1_traffic_detection" / "data" / "uploads" / "custom" / "pending",
+        WORKSPACE_ROOT / "module_1_traffic_detection" / "data" / "uploads" / "custom" / "processed",
     ]
     for target in legacy_paths:
         if target.exists() and target.is_dir():
@@ -406,8 +547,7 @@ def clear_module1_upload_artifacts() -> None:
 
 
 def clear_output_frames_on_disk() -> None:
-    workspace_root = Path(__file__).resolve().parent.parent.parent
-    outputs_root = workspace_root / "module_1_traffic_detection" / "output_frames"
+    outputs_root = OUTPUT_FRAMES_ROOT
     if not outputs_root.exists():
         return
     for direction_dir in outputs_root.iterdir():
@@ -427,6 +567,9 @@ def clear_module1_results_file() -> None:
     ingestor.load_recent()
 
 
+MODULE_1_OUTPUT_TAIL_LINES = 50
+
+
 def run_module_1_processing(
     run_id: str,
     junction_type: str,
@@ -439,7 +582,7 @@ def run_module_1_processing(
     logger.info(f"Starting Module 1 processing for {junction_type} with videos: {video_paths}")
     
     # Clean up output_frames to ensure fresh results
-    output_frames_dir = Path(__file__).resolve().parent.parent.parent / "module_1_traffic_detection" / "output_frames"
+    output_frames_dir = OUTPUT_FRAMES_ROOT
     if output_frames_dir.exists():
         # We only want to delete the contents, not the directory itself if possible, 
         # but recreating it is safer to remove all subdirs.
@@ -474,21 +617,31 @@ def run_module_1_processing(
         
     try:
         # Run from the workspace root (parent of module_2_signal_logic)
-        cwd = Path(__file__).resolve().parent.parent.parent
+        cwd = WORKSPACE_ROOT
         
-        result = subprocess.run(
+        # Stream output line by line so long runs don't buffer their whole log;
+        # only a short tail is kept for the failure report.
+        output_tail: deque[str] = deque(maxlen=MODULE_1_OUTPUT_TAIL_LINES)
+        with subprocess.Popen(
             cmd,
             cwd=cwd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            check=True
-        )
+            bufsize=1,
+        ) as proc:
+            for line in proc.stdout:
+                line = line.rstrip()
+                output_tail.append(line)
+                logger.debug(line)
+            returncode = proc.wait()
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, cmd, output="\n".join(output_tail))
         logger.info("Module 1 processing complete.")
-        logger.debug(result.stdout)
         update_upload_status(run_id, "completed")
     except subprocess.CalledProcessError as e:
         logger.error(f"Module 1 processing failed: {e}")
-        logger.error(e.stderr)
+        logger.error(e.output)
         update_upload_status(run_id, "failed", str(e))
     except Exception as e:
         logger.exception(f"Unexpected error running Module 1: {e}")
@@ -551,15 +704,12 @@ async def ingest_uploads(
     """
     Accepts video uploads for specific directions and triggers processing.
     """
-    # Resolve workspace root relative to this file
-    workspace_root = Path(__file__).resolve().parent.parent.parent
-
     retain_flag = str(retain_uploads).lower() in {"true", "1", "yes", "on"}
 
     if not retain_flag:
         clear_module1_upload_artifacts()
 
-    upload_dir = workspace_root / "module_1_traffic_detection" / "observation_videos"
+    upload_dir = WORKSPACE_ROOT / "module_1_traffic_detection" / "observation_videos"
     if upload_dir.exists():
         shutil.rmtree(upload_dir)
     upload_dir.mkdir(parents=True, exist_ok=True)
@@ -617,8 +767,35 @@ async def ingest_uploads(
     )
 
 
+def _scan_frame_dir(
+    directory: Union[Path, str],
+) -> Tuple[Optional[os.DirEntry], List[os.DirEntry], Dict[str, os.DirEntry]]:
+    """Split a frame directory into its latest frame, numbered frames and subdirectories.
+
+    A single scandir pass replaces the separate exists/glob/iterdir calls; a
+    missing directory yields empty results.
+    """
+    latest: Optional[os.DirEntry] = None
+    frames: List[os.DirEntry] = []
+    subdirs: Dict[str, os.DirEntry] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    subdirs[name] = entry
+                elif name == "latest.jpg":
+                    latest = entry
+                elif name.startswith("frame_") and name.endswith(".jpg"):
+                    frames.append(entry)
+    except (FileNotFoundError, NotADirectoryError):
+        return None, [], {}
+    frames.sort(key=lambda entry: entry.name)
+    return latest, frames, subdirs
+
+
 @app.get("/media/output")
-async def media_output(request: Request) -> dict:
+async def media_output(request: Request) -> FastJSONResponse:
     """
     Serve a manifest of the latest processed frames from Module 1.
     This endpoint scans the 'output_frames' directory and returns URLs
@@ -628,11 +805,7 @@ async def media_output(request: Request) -> dict:
     # dashboard can fetch images without relying on a separate dev server.
     
     output_root = OUTPUT_FRAMES_ROOT
-    available_dirs = {
-        path.name: path
-        for path in output_root.iterdir()
-        if path.is_dir()
-    } if output_root.exists() else {}
+    _, _, available_dirs = _scan_frame_dir(output_root)
 
     metadata = ingestor.metadata
     upload_record = resolve_active_upload()
@@ -655,7 +828,7 @@ async def media_output(request: Request) -> dict:
     }
 
     def build_frame_entry(
-        file_path: Path,
+        entry: os.DirEntry,
         *,
         direction: str,
         lane_label: str,
@@ -664,9 +837,10 @@ async def media_output(request: Request) -> dict:
         annotation: Optional[str] = None,
         suffix: Optional[str] = None,
     ) -> dict:
+        file_path = Path(entry.path)
         relative_path = file_path.relative_to(output_root)
         url = str(request.url_for("media-files", path=relative_path.as_posix()))
-        captured = datetime.fromtimestamp(file_path.stat().st_mtime, timezone.utc).isoformat()
+        captured = datetime.fromtimestamp(entry.stat().st_mtime, timezone.utc).isoformat()
         identifier = f"{direction}-{suffix}" if suffix else f"{direction}-{file_path.stem}"
         return {
             "id": identifier,
@@ -680,18 +854,18 @@ async def media_output(request: Request) -> dict:
         }
 
     for direction in direction_sequence:
-        direction_dir = available_dirs.get(direction) or (output_root / direction)
-        if not direction_dir.exists() or not direction_dir.is_dir():
+        direction_entry = available_dirs.get(direction)
+        if direction_entry is None:
             continue
+        latest_entry, frame_entries, subdirs = _scan_frame_dir(direction_entry.path)
 
         frames: List[Dict[str, Any]] = []
         lane_label = lane_aliases.get(direction, direction.replace("_", " ").title())
 
-        latest_path = direction_dir / "latest.jpg"
-        if latest_path.exists():
+        if latest_entry is not None:
             frames.append(
                 build_frame_entry(
-                    latest_path,
+                    latest_entry,
                     direction=direction,
                     lane_label=lane_label,
                     category="full",
@@ -700,26 +874,26 @@ async def media_output(request: Request) -> dict:
                 )
             )
 
-        for frame_file in sorted(direction_dir.glob("frame_*.jpg")):
+        for frame_entry in frame_entries:
             frames.append(
                 build_frame_entry(
-                    frame_file,
+                    frame_entry,
                     direction=direction,
                     lane_label=lane_label,
                     category="full",
-                    label=f"Frame {frame_file.stem.split('_')[-1]}",
+                    label=f"Frame {Path(frame_entry.name).stem.split('_')[-1]}",
                 )
             )
 
-        classes_dir = direction_dir / "classes"
-        if classes_dir.exists() and classes_dir.is_dir():
-            for class_dir in sorted(p for p in classes_dir.iterdir() if p.is_dir()):
-                class_name = class_dir.name
-                latest_class_path = class_dir / "latest.jpg"
-                if latest_class_path.exists():
+        classes_entry = subdirs.get("classes")
+        if classes_entry is not None:
+            _, _, class_dirs = _scan_frame_dir(classes_entry.path)
+            for class_name in sorted(class_dirs):
+                latest_class_entry, class_frames, _ = _scan_frame_dir(class_dirs[class_name].path)
+                if latest_class_entry is not None:
                     frames.append(
                         build_frame_entry(
-                            latest_class_path,
+                            latest_class_entry,
                             direction=direction,
                             lane_label=lane_label,
                             category="class",
@@ -729,16 +903,17 @@ async def media_output(request: Request) -> dict:
                         )
                     )
 
-                for class_frame in sorted(class_dir.glob("frame_*.jpg")):
+                for class_frame in class_frames:
+                    class_frame_stem = Path(class_frame.name).stem
                     frames.append(
                         build_frame_entry(
                             class_frame,
                             direction=direction,
                             lane_label=lane_label,
                             category="class",
-                            label=f"{class_name.title()} {class_frame.stem.split('_')[-1]}",
+                            label=f"{class_name.title()} {class_frame_stem.split('_')[-1]}",
                             annotation=class_name.title(),
-                            suffix=f"{class_name}-{class_frame.stem}",
+                            suffix=f"{class_name}-{class_frame_stem}",
                         )
                     )
 
@@ -752,7 +927,7 @@ async def media_output(request: Request) -> dict:
         }
         manifest["groups"].append(group)
 
-    return manifest
+    return FastJSONResponse(manifest)
 
 
 @app.post("/media/clear", status_code=204)
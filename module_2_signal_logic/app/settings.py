@@ -2,7 +2,12 @@ import json
 from pathlib import Path
 from typing import List, Optional
 
-from pydantic import BaseSettings, Field, root_validator
+from pydantic import BaseSettings, Field, root_validator, validator
+
+from module_2_signal_logic.adapters import serialization
+
+# Lower bound for the cycle worker wake-up interval; tighter values only burn CPU.
+MIN_POLL_INTERVAL_SECONDS = 0.5
 
 
 class AppSettings(BaseSettings):
@@ -12,6 +17,8 @@ class AppSettings(BaseSettings):
     state_snapshot_path: Path = Field(default_factory=lambda: Path(__file__).resolve().parents[1] / "storage" / "state_snapshot.json")
     junction_profile_path: Path = Field(default_factory=lambda: Path(__file__).resolve().parents[2] / "module_1_traffic_detection" / "data" / "junction_profile.json")
     poll_interval_seconds: float = 2.0
+    history_fsync_every: int = 16
+    history_limit: int = 1000
     window_size: int = 20
     lanes: List[str] = Field(default_factory=lambda: ["north", "east", "south", "west"])
     cooldown_duration: float = 10.0
@@ -35,6 +42,10 @@ class AppSettings(BaseSettings):
         env_file = ".env"
         env_file_encoding = "utf-8"
 
+    @validator("poll_interval_seconds")
+    def _floor_poll_interval(cls, value: float) -> float:
+        return max(value, MIN_POLL_INTERVAL_SECONDS)
+
     @root_validator(pre=False)
     def _apply_profile(cls, values: dict) -> dict:
         profile_path: Path = values.get("junction_profile_path")
@@ -42,7 +53,7 @@ class AppSettings(BaseSettings):
         junction_type: Optional[str] = values.get("junction_type")
         if profile_path and profile_path.exists():
             try:
-                profile = json.loads(profile_path.read_text())
+                profile = serialization.loads(profile_path.read_bytes())
             except (json.JSONDecodeError, OSError):
                 profile = {}
             directions = profile.get("directions")
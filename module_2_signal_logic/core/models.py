@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -15,17 +16,62 @@ class LaneSnapshot(BaseModel):
     junction_type: Optional[str] = None
 
 
-class PriorityBreakdown(BaseModel):
+# Breakdowns and decisions are built internally on every cycle, so they are
+# plain dataclasses with hand-written __slots__ (dataclass(slots=True) needs
+# Python 3.10); pydantic validation stays at the ingest boundary
+# (LaneSnapshot). Serialize them with dataclasses.asdict.
+@dataclass(init=False)
+class PriorityBreakdown:
+    __slots__ = (
+        "lane",
+        "vehicle_count",
+        "waiting_time",
+        "cooldown_penalty",
+        "score",
+        "vehicle_gap",
+        "forecast_count",
+    )
+
     lane: str
     vehicle_count: int
     waiting_time: float
     cooldown_penalty: float
-    vehicle_gap: float = 0.0
-    forecast_count: float = 0.0
     score: float
+    vehicle_gap: float
+    forecast_count: float
+
+    # written out because slotted fields cannot carry class-level defaults
+    def __init__(
+        self,
+        lane: str,
+        vehicle_count: int,
+        waiting_time: float,
+        cooldown_penalty: float,
+        score: float,
+        vehicle_gap: float = 0.0,
+        forecast_count: float = 0.0,
+    ) -> None:
+        self.lane = lane
+        self.vehicle_count = vehicle_count
+        self.waiting_time = waiting_time
+        self.cooldown_penalty = cooldown_penalty
+        self.score = score
+        self.vehicle_gap = vehicle_gap
+        self.forecast_count = forecast_count
+
 
+@dataclass
+class CycleDecision:
+    __slots__ = (
+        "cycle_id",
+        "decided_at",
+        "green_lane",
+        "green_duration",
+        "priorities",
+        "effective_from",
+        "effective_until",
+    )
 
-class CycleDecision(BaseModel):
     cycle_id: int
     decided_at: datetime
     green_lane: str
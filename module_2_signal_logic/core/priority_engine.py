@@ -1,3 +1,5 @@
+import heapq
+from operator import itemgetter
 from typing import Dict, Iterable, List, Optional
 
 from module_2_signal_logic.core.models import LaneSnapshot, PriorityBreakdown
@@ -28,37 +30,60 @@ class PriorityEngine:
         recent_cooldowns: Dict[str, float],
         vehicle_gaps: Optional[Dict[str, float]] = None,
         forecasts: Optional[Dict[str, float]] = None,
+        top_k: Optional[int] = None,
     ) -> List[PriorityBreakdown]:
-        breakdowns: List[PriorityBreakdown] = []
+        """Score every lane and return the breakdowns best-first.
+
+        When `top_k` is given only the `top_k` best lanes are returned, selected
+        with a heap instead of sorting the full list. Scores are computed on
+        plain tuples and breakdown models are only built for returned lanes.
+        """
+        rows: List[tuple] = []
         vehicle_gaps = vehicle_gaps or {}
         forecasts = forecasts or {}
+        lane_counts = snapshot.lane_counts
+        # bind weights once instead of re-reading attributes per lane
+        density_weight = self.density_weight
+        wait_weight = self.wait_weight
+        cooldown_weight = self.cooldown_penalty
+        gap_weight = self.gap_weight
+        forecast_weight = self.forecast_weight
+        # Junctions have 1-4 lanes, so this plain loop is cheaper than handing
+        # the arithmetic to NumPy or a JIT kernel, whose per-call dispatch costs
+        # more than the handful of float ops done here.
         for lane in lanes:
-            vehicle_count = max(snapshot.lane_counts.get(lane, 0), 0)
+            vehicle_count = max(lane_counts.get(lane, 0), 0)
             waiting_time = max(waiting_times.get(lane, 0.0), 0.0)
             penalty_seconds = max(recent_cooldowns.get(lane, 0.0), 0.0)
             gap_seconds = max(vehicle_gaps.get(lane, 0.0), 0.0)
-            gap_component = self.gap_weight / (1.0 + gap_seconds)
+            # active lanes report a zero gap, where the division is a no-op
+            gap_component = gap_weight / (1.0 + gap_seconds) if gap_seconds else gap_weight
             forecast_count = max(forecasts.get(lane, 0.0), 0.0)
             score = (
-                vehicle_count * self.density_weight
-                + waiting_time * self.wait_weight
+                vehicle_count * density_weight
+                + waiting_time * wait_weight
                 + gap_component
-                + forecast_count * self.forecast_weight
-                - penalty_seconds * self.cooldown_penalty
+                + forecast_count * forecast_weight
+                - penalty_seconds * cooldown_weight
             )
-            breakdowns.append(
-                PriorityBreakdown(
-                    lane=lane,
-                    vehicle_count=vehicle_count,
-                    waiting_time=waiting_time,
-                    cooldown_penalty=penalty_seconds,
-                    vehicle_gap=gap_seconds,
-                    forecast_count=forecast_count,
-                    score=score,
-                )
+            rows.append((score, waiting_time, vehicle_count, lane, penalty_seconds, gap_seconds, forecast_count))
+        if top_k is not None:
+            rows = heapq.nlargest(top_k, rows, key=_priority_key)
+        else:
+            rows.sort(key=_priority_key, reverse=True)
+        return [
+            PriorityBreakdown(
+                lane=lane,
+                vehicle_count=vehicle_count,
+                waiting_time=waiting_time,
+                cooldown_penalty=penalty_seconds,
+                vehicle_gap=gap_seconds,
+                forecast_count=forecast_count,
+                score=score,
             )
-        breakdowns.sort(
-            key=lambda item: (item.score, item.waiting_time, item.vehicle_count),
-            reverse=True,
-        )
-        return breakdowns
+            for score, waiting_time, vehicle_count, lane, penalty_seconds, gap_seconds, forecast_count in rows
+        ]
+
+
+# (score, waiting_time, vehicle_count) prefix of a scoring row
+_priority_key = itemgetter(0, 1, 2)
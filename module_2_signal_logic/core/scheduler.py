@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Iterable, List, Mapping, Optional, Tuple, Union
 
 from module_2_signal_logic.core.models import CycleDecision, PriorityBreakdown
 
@@ -11,6 +11,41 @@ class SchedulerConfig:
     min_green: float = 10.0
     max_green: float = 60.0
     scaling_factor: float = 20.0
+    # report CycleDecision.priorities best-first; consumers that only read the
+    # chosen lane/duration can turn this off to skip the full sort
+    sort_priorities: bool = True
+
+
+def select_top_two(breakdowns: Iterable[PriorityBreakdown]) -> List[PriorityBreakdown]:
+    """Return the best and runner-up lanes in a single pass.
+
+    Lanes rank by (score, waiting_time, vehicle_count) and ties keep their
+    input order, as a stable descending sort would. Fewer than two lanes in
+    gives fewer out.
+    """
+    return _scan_top_two(breakdowns)[0]
+
+
+def _scan_top_two(breakdowns: Iterable[PriorityBreakdown]) -> Tuple[List[PriorityBreakdown], int]:
+    # select_top_two plus the non-negative vehicle total, in the same loop
+    best: Optional[PriorityBreakdown] = None
+    runner_up: Optional[PriorityBreakdown] = None
+    best_key: tuple = ()
+    runner_up_key: tuple = ()
+    total_vehicles = 0
+    for breakdown in breakdowns:
+        vehicle_count = breakdown.vehicle_count
+        if vehicle_count > 0:
+            total_vehicles += vehicle_count
+        key = (breakdown.score, breakdown.waiting_time, vehicle_count)
+        if best is None or key > best_key:
+            runner_up, runner_up_key = best, best_key
+            best, best_key = breakdown, key
+        elif runner_up is None or key > runner_up_key:
+            runner_up, runner_up_key = breakdown, key
+    if best is None:
+        return [], total_vehicles
+    return ([best] if runner_up is None else [best, runner_up]), total_vehicles
 
 
 class SignalScheduler:
@@ -23,17 +58,48 @@ class SignalScheduler:
 
     def next_cycle(
         self,
-        priorities: Dict[str, PriorityBreakdown],
+        priorities: Union[Mapping[str, PriorityBreakdown], Iterable[PriorityBreakdown]],
         decided_at: datetime,
+        *,
+        full_order: Optional[bool] = None,
     ) -> CycleDecision:
-        if not priorities:
-            raise ValueError("Cannot schedule cycle without priorities")
+        """Pick the next green lane.
 
-        def _sorting_key(item: PriorityBreakdown) -> tuple:
-            return (item.score, item.waiting_time, item.vehicle_count)
+        `priorities` is either a lane -> breakdown mapping or the breakdowns
+        themselves (one per lane), e.g. straight from `PriorityEngine.score_lanes`.
+
+        The decision only needs the two best lanes. When `full_order` is False
+        (default: `config.sort_priorities`) they are picked by `select_top_two`
+        and `CycleDecision.priorities` keeps the lanes in input order.
+        """
+        if full_order is None:
+            full_order = self.config.sort_priorities
+        if isinstance(priorities, Mapping):
+            breakdowns = list(priorities.values())
+        elif isinstance(priorities, list):
+            breakdowns = priorities
+        else:
+            breakdowns = list(priorities)
+        if not breakdowns:
+            raise ValueError("Cannot schedule cycle without priorities")
 
-        # Sort all lanes by priority
-        ordered_priorities = sorted(priorities.values(), key=_sorting_key, reverse=True)
+        if full_order:
+            # Decorate lanes with their sort key and collect vehicle totals in one
+            # pass, then sort the plain tuples. The negated index keeps ties in
+            # input order and means comparisons never reach the breakdown itself.
+            keyed: List[tuple] = []
+            total_vehicles = 0
+            for index, breakdown in enumerate(breakdowns):
+                keyed.append(
+                    (breakdown.score, breakdown.waiting_time, breakdown.vehicle_count, -index, breakdown)
+                )
+                total_vehicles += max(breakdown.vehicle_count, 0)
+            keyed.sort(reverse=True)
+            ordered_priorities = [item[-1] for item in keyed]
+            reported_priorities = ordered_priorities
+        else:
+            ordered_priorities, total_vehicles = _scan_top_two(breakdowns)
+            reported_priorities = list(breakdowns)
         
         # STRICT ALTERNATION RULE: Never allow same lane twice in a row
         # This ensures realistic traffic light behavior
@@ -46,7 +112,6 @@ class SignalScheduler:
         # Update last green lane tracker
         self._last_green_lane = top_breakdown.lane
         
-        total_vehicles = sum(max(b.vehicle_count, 0) for b in priorities.values())
         ratio = (top_breakdown.vehicle_count / total_vehicles) if total_vehicles else 0.0
 
         proposed_green = self.config.base_green + ratio * self.config.scaling_factor
@@ -60,7 +125,7 @@ class SignalScheduler:
             decided_at=decided_at,
             green_lane=top_breakdown.lane,
             green_duration=green_duration,
-            priorities=ordered_priorities,
+            priorities=reported_priorities,
             effective_from=effective_from,
             effective_until=effective_until,
         )
@@ -1,6 +1,8 @@
+import sys
 from collections import defaultdict
 from datetime import datetime
-from typing import DefaultDict, Dict, Iterable, List, Optional
+from types import MappingProxyType
+from typing import DefaultDict, Dict, Iterable, List, Mapping, Optional
 
 
 class StateStore:
@@ -8,11 +10,9 @@ class StateStore:
 
     def __init__(self, lanes: Iterable[str], cooldown_duration: float = 10.0) -> None:
         self._lanes: List[str] = []
+        self._lane_ids: Dict[str, int] = {}
         for lane in lanes:
-            if lane is None:
-                continue
-            if lane not in self._lanes:
-                self._lanes.append(lane)
+            self._register_lane(lane)
         self.cooldown_duration = max(cooldown_duration, 0.0)
         self.current_green: Optional[str] = None
         self.current_green_started_at: Optional[datetime] = None
@@ -20,12 +20,19 @@ class StateStore:
         self._cooldowns: DefaultDict[str, float] = defaultdict(float)
         self.reset()
 
+    def _register_lane(self, lane: Optional[str]) -> None:
+        if lane is None or lane in self._lane_ids:
+            return
+        # interned names make the per-tick dict lookups identity hits
+        lane = sys.intern(lane)
+        self._lane_ids[lane] = len(self._lanes)
+        self._lanes.append(lane)
+
     def ensure_lanes(self, lanes: Iterable[str]) -> None:
         for lane in lanes:
             if lane is None:
                 continue
-            if lane not in self._lanes:
-                self._lanes.append(lane)
+            self._register_lane(lane)
             # initialize dictionaries to avoid KeyError
             _ = self._waiting_times[lane]
             _ = self._cooldowns[lane]
@@ -33,17 +40,18 @@ class StateStore:
     def tick(self, delta_seconds: float) -> None:
         if delta_seconds <= 0:
             return
+        waiting_times = self._waiting_times
+        cooldowns = self._cooldowns
+        # advance every lane uniformly, then zero the green lane once instead of
+        # comparing each lane against it
         for lane in self._lanes:
-            if lane != self.current_green:
-                self._waiting_times[lane] += delta_seconds
-            else:
-                self._waiting_times[lane] = 0.0
-            current_cooldown = self._cooldowns[lane]
-            if current_cooldown > 0:
-                self._cooldowns[lane] = max(0.0, current_cooldown - delta_seconds)
+            waiting_times[lane] += delta_seconds
+            cooldowns[lane] = max(0.0, cooldowns[lane] - delta_seconds)
+        if self.current_green is not None:
+            waiting_times[self.current_green] = 0.0
 
     def mark_green(self, lane: str, timestamp: datetime) -> None:
-        if lane not in self._lanes:
+        if lane not in self._lane_ids:
             raise ValueError(f"Unknown lane '{lane}'")
         self.current_green = lane
         self.current_green_started_at = timestamp
@@ -59,12 +67,23 @@ class StateStore:
     def waiting_times(self) -> Dict[str, float]:
         return dict(self._waiting_times)
 
+    def waiting_times_view(self) -> Mapping[str, float]:
+        """Read-only live view of waiting times; reflects later ticks."""
+        return MappingProxyType(self._waiting_times)
+
     def cooldowns(self) -> Dict[str, float]:
         return dict(self._cooldowns)
 
     def lanes(self) -> List[str]:
         return list(self._lanes)
 
+    def lane_count(self) -> int:
+        return len(self._lanes)
+
+    def lane_ids_view(self) -> Mapping[str, int]:
+        """Read-only live map of lane -> registration index, in registration order."""
+        return MappingProxyType(self._lane_ids)
+
     def reset(self) -> None:
         self.current_green = None
         self.current_green_started_at = None
@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import argparse
-import json
-from collections import defaultdict
+import math
 from pathlib import Path
-from statistics import mean
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
+from module_2_signal_logic.adapters import serialization
 from module_2_signal_logic.adapters.file_ingestor import ResultsFileIngestor
 from module_2_signal_logic.adapters.persistence import JsonPersistence
 from module_2_signal_logic.app.settings import get_settings
@@ -19,6 +18,26 @@ from module_2_signal_logic.core.state_store import StateStore
 from module_2_signal_logic.services.signal_service import SignalService
 
 
+class SnapshotView(Sequence[LaneSnapshot]):
+    """Read-only prefix of a snapshot list, exposed without copying it."""
+
+    def __init__(self, snapshots: List[LaneSnapshot], end: int) -> None:
+        self._snapshots = snapshots
+        self._end = end
+
+    def __len__(self) -> int:
+        return self._end
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._snapshots[i] for i in range(*index.indices(self._end))]
+        if index < 0:
+            index += self._end
+        if not 0 <= index < self._end:
+            raise IndexError("snapshot index out of range")
+        return self._snapshots[index]
+
+
 class ReplayIngestor:
     """Simple ingestor that reveals snapshots incrementally during replay."""
 
@@ -33,10 +52,11 @@ class ReplayIngestor:
         self._cursor += 1
         return True
 
-    def load_recent(self) -> List[LaneSnapshot]:
+    def load_recent(self) -> Sequence[LaneSnapshot]:
         if self._cursor < 0:
             return []
-        return self._snapshots[: self._cursor + 1]
+        # a view, not a slice: copying the prefix each step made replays O(N^2)
+        return SnapshotView(self._snapshots, self._cursor + 1)
 
     @property
     def metadata(self) -> Dict:
@@ -52,6 +72,8 @@ def _build_service(ingestor: ReplayIngestor, history_path: Path, snapshot_path:
             min_green=settings.min_green_seconds,
             max_green=settings.max_green_seconds,
             scaling_factor=settings.scaling_factor,
+            # the replay summary only reads green durations
+            sort_priorities=False,
         )
     )
     priority_engine = PriorityEngine(
@@ -83,7 +105,8 @@ def _load_snapshots(results_path: Path, window_size: int) -> tuple[List[LaneSnap
 
 
 def _compute_summary(
-    cycle_durations: List[float],
+    cycles: int,
+    green_total: float,
     wait_samples: Dict[str, int],
     wait_totals: Dict[str, float],
     wait_max: Dict[str, float],
@@ -93,24 +116,30 @@ def _compute_summary(
     final_status: Dict,
     total_steps: int,
 ) -> Dict:
-    avg_wait = {
-        lane: (wait_totals[lane] / wait_samples[lane]) if wait_samples[lane] else 0.0
-        for lane in wait_totals
-    }
-    fairness_delta = 0.0
-    if avg_wait:
-        fairness_delta = max(avg_wait.values()) - min(avg_wait.values())
+    # average per lane and track the spread in the same pass
+    avg_wait: Dict[str, float] = {}
+    lowest = math.inf
+    highest = -math.inf
+    for lane, total in wait_totals.items():
+        samples = wait_samples[lane]
+        average = (total / samples) if samples else 0.0
+        avg_wait[lane] = average
+        if average < lowest:
+            lowest = average
+        if average > highest:
+            highest = average
+    fairness_delta = (highest - lowest) if avg_wait else 0.0
     summary = {
-        "cycles": len(cycle_durations),
-        "average_green_duration": mean(cycle_durations) if cycle_durations else 0.0,
+        "cycles": cycles,
+        "average_green_duration": (green_total / cycles) if cycles else 0.0,
         "average_wait_by_lane": avg_wait,
         "max_wait_by_lane": wait_max,
         "fairness_delta": fairness_delta,
         "average_latency_ms": (latency_total / latency_samples) if latency_samples else 0.0,
         "stale_incidents": stale_incidents,
-        "final_lane_counts": final_status.get("lane_counts", {}),
-        "final_lane_totals": final_status.get("lane_totals", {}),
-        "final_lane_forecasts": final_status.get("lane_forecasts", {}),
+        "final_lane_counts": dict(final_status.get("lane_counts", {})),
+        "final_lane_totals": dict(final_status.get("lane_totals", {})),
+        "final_lane_forecasts": dict(final_status.get("lane_forecasts", {})),
         "steps_processed": total_steps,
     }
     return summary
@@ -129,10 +158,10 @@ def run_replay(results_path: Path, window_size: int, output_dir: Path, output_js
     history_path, snapshot_path = _setup_paths(output_dir)
     service = _build_service(ingestor, history_path, snapshot_path)
 
-    wait_totals: Dict[str, float] = defaultdict(float)
-    wait_samples: Dict[str, int] = defaultdict(int)
-    wait_max: Dict[str, float] = defaultdict(float)
-    cycle_durations: List[float] = []
+    # lane -> [wait_total, wait_samples, wait_max], so each lane costs one lookup per step
+    wait_stats: Dict[str, list] = {}
+    cycles = 0
+    green_total = 0.0
     latency_total = 0.0
     latency_samples = 0
     stale_incidents = 0
@@ -149,24 +178,29 @@ def run_replay(results_path: Path, window_size: int, output_dir: Path, output_js
             stale_incidents += 1
             continue
 
-        status = service.snapshot(now, hydrate=False)
-        for lane, wait in status.get("lane_wait_times", {}).items():
-            wait_totals[lane] += wait
-            wait_samples[lane] += 1
-            if wait > wait_max[lane]:
-                wait_max[lane] = wait
+        for lane, wait in service.wait_times_view().items():
+            stats = wait_stats.get(lane)
+            if stats is None:
+                stats = wait_stats[lane] = [0.0, 0, 0.0]
+            stats[0] += wait
+            stats[1] += 1
+            if wait > stats[2]:
+                stats[2] = wait
         if decision:
-            cycle_durations.append(decision.green_duration)
+            cycles += 1
+            green_total += decision.green_duration
         if snapshot.latency_ms is not None:
             latency_total += snapshot.latency_ms
             latency_samples += 1
 
     final_status = service.snapshot(snapshots[-1].timestamp, hydrate=False)
+    service.persistence.close()
     summary = _compute_summary(
-        cycle_durations,
-        wait_samples,
-        wait_totals,
-        wait_max,
+        cycles,
+        green_total,
+        {lane: stats[1] for lane, stats in wait_stats.items()},
+        {lane: stats[0] for lane, stats in wait_stats.items()},
+        {lane: stats[2] for lane, stats in wait_stats.items()},
         latency_samples,
         latency_total,
         stale_incidents,
@@ -176,7 +210,7 @@ def run_replay(results_path: Path, window_size: int, output_dir: Path, output_js
 
     if output_json is not None:
         output_json.parent.mkdir(parents=True, exist_ok=True)
-        output_json.write_text(json.dumps(summary, indent=2))
+        output_json.write_bytes(serialization.dumps(summary, indent=True))
 
     return summary
 
@@ -1,23 +1,70 @@
 import logging
-from collections import defaultdict
+from collections import deque
 from datetime import datetime, timezone
-from statistics import mean
-from typing import Dict, List, Optional
+from itertools import chain
+from types import MappingProxyType
+from typing import Deque, Dict, List, Mapping, Optional, Tuple
 
 from module_2_signal_logic.adapters.file_ingestor import ResultsFileIngestor
 from module_2_signal_logic.adapters.persistence import JsonPersistence
 from module_2_signal_logic.core.models import CycleDecision, LaneSnapshot, PriorityBreakdown
 from module_2_signal_logic.core.priority_engine import PriorityEngine
-from module_2_signal_logic.core.scheduler import SignalScheduler
+from module_2_signal_logic.core.scheduler import SignalScheduler, select_top_two
 from module_2_signal_logic.core.state_store import StateStore
 
 
 logger = logging.getLogger(__name__)
 
+# snapshot() reuses its last result within this window, which bounds how stale
+# the time-derived fields (remaining_seconds, waits, last_updated) can be
+SNAPSHOT_RESOLUTION_SECONDS = 0.25
+
+# Decisions kept in memory for history() and the metrics averages.
+HISTORY_LIMIT = 1000
+
 
 class SignalService:
     """Coordinate ingestion, priority computation, scheduling, and persistence."""
 
+    # every attribute is assigned in __init__; slots keep lookups in the
+    # per-tick paths off the instance dict
+    __slots__ = (
+        "ingestor",
+        "priority_engine",
+        "scheduler",
+        "state_store",
+        "persistence",
+        "telemetry_stale_after",
+        "forecast_horizon",
+        "forecast_smoothing",
+        "_history",
+        "_wait_totals",
+        "_wait_counts",
+        "_green_total",
+        "_cycles_executed",
+        "_last_tick_ts",
+        "_active_decision",
+        "_last_priorities",
+        "_last_snapshot",
+        "_frame_fields",
+        "_lane_totals",
+        "_lane_last_activity",
+        "_lane_gaps",
+        "_lane_total_timestamp",
+        "_lane_arrival_rate",
+        "_lane_forecast",
+        "_last_processed_frame",
+        "_lane_totals_view",
+        "_lane_gaps_view",
+        "_lane_forecast_view",
+        "_stale_incidents",
+        "_state_version",
+        "_snapshot_cache",
+        "_persisted_state_version",
+        "_prediction_cache",
+        "_junction_type_cache",
+    )
+
     def __init__(
         self,
         ingestor: ResultsFileIngestor,
@@ -28,6 +75,7 @@ class SignalService:
         telemetry_stale_after: float = 0.0,
         forecast_horizon: float = 0.0,
         forecast_smoothing: float = 0.5,
+        history_limit: int = HISTORY_LIMIT,
     ) -> None:
         self.ingestor = ingestor
         self.priority_engine = priority_engine
@@ -37,76 +85,136 @@ class SignalService:
         self.telemetry_stale_after = max(telemetry_stale_after, 0.0)
         self.forecast_horizon = max(forecast_horizon, 0.0)
         self.forecast_smoothing = min(max(forecast_smoothing, 0.0), 1.0)
-        self._history: List[CycleDecision] = []
-        self._last_tick_at: Optional[datetime] = None
+        self._history: Deque[CycleDecision] = deque(maxlen=max(history_limit, 1))
+        # running sums over self._history so metrics() never walks it
+        self._wait_totals: Dict[str, float] = {}
+        self._wait_counts: Dict[str, int] = {}
+        self._green_total: float = 0.0
+        self._cycles_executed: int = 0
+        # hot-path clocks are POSIX seconds so per-tick deltas are float subtraction
+        self._last_tick_ts: Optional[float] = None
         self._active_decision: Optional[CycleDecision] = None
         self._last_priorities: List[PriorityBreakdown] = []
         self._last_snapshot: Optional[LaneSnapshot] = None
+        # (lane_counts, signal_states, junction_type) of _last_snapshot, built
+        # once per frame and spliced into every snapshot() payload
+        self._frame_fields: Optional[Tuple[Mapping[str, int], Mapping[str, str], Optional[str]]] = None
         self._lane_totals: Dict[str, int] = {}
-        self._lane_last_activity: Dict[str, datetime] = {}
+        self._lane_last_activity: Dict[str, float] = {}
         self._lane_gaps: Dict[str, float] = {}
-        self._lane_total_timestamp: Dict[str, datetime] = {}
+        self._lane_total_timestamp: Dict[str, float] = {}
         self._lane_arrival_rate: Dict[str, float] = {}
         self._lane_forecast: Dict[str, float] = {}
+        # (frame_id, timestamp) of the snapshot last folded into the lane state
+        self._last_processed_frame: Optional[Tuple[Optional[int], float]] = None
+        # snapshot() publishes these read-only views; the dicts are only ever
+        # cleared, never rebound, so the views stay valid
+        self._lane_totals_view = MappingProxyType(self._lane_totals)
+        self._lane_gaps_view = MappingProxyType(self._lane_gaps)
+        self._lane_forecast_view = MappingProxyType(self._lane_forecast)
         self._stale_incidents: int = 0
+        # bumped whenever the frame or lane state changes (not on clock ticks or
+        # re-reads of an unchanged frame), so it can key the snapshot cache
+        self._state_version: int = 0
+        self._snapshot_cache: Optional[Tuple[tuple, dict]] = None
+        # state version of the snapshot last written; clock ticks alone do not
+        # rewrite it, so on disk remaining_seconds/last_updated date from the
+        # last state change
+        self._persisted_state_version: Optional[int] = None
+        # (cycle_id, prediction) for the current _last_priorities
+        self._prediction_cache: Optional[Tuple[Optional[int], PriorityBreakdown]] = None
+        # (ingestor metadata_version, junction_type) used when no snapshot is loaded
+        self._junction_type_cache: Optional[Tuple[Optional[int], Optional[str]]] = None
 
     def _apply_tick(self, now: datetime) -> None:
-        if self._last_tick_at is None:
-            self._last_tick_at = now
+        now_ts = now.timestamp()
+        if self._last_tick_ts is None:
+            self._last_tick_ts = now_ts
             return
-        delta_seconds = (now - self._last_tick_at).total_seconds()
+        delta_seconds = now_ts - self._last_tick_ts
         if delta_seconds > 0:
             self.state_store.tick(delta_seconds)
-        self._last_tick_at = now
+        self._last_tick_ts = now_ts
 
     def _latest_snapshot(self) -> LaneSnapshot:
         snapshots = self.ingestor.load_recent()
         if not snapshots:
             raise RuntimeError("No telemetry snapshots available from Module 1")
-        self._last_snapshot = snapshots[-1]
+        latest = snapshots[-1]
+        if latest is not self._last_snapshot:
+            self._frame_fields = (
+                MappingProxyType(latest.lane_counts),
+                MappingProxyType(latest.signal_states),
+                latest.junction_type,
+            )
+            self._state_version += 1
+        self._last_snapshot = latest
         self.state_store.ensure_lanes(self._last_snapshot.lane_counts.keys())
         self._update_lane_activity(self._last_snapshot)
         return self._last_snapshot
 
     def _update_lane_activity(self, snapshot: LaneSnapshot) -> None:
-        lanes = {lane for lane in self.state_store.lanes()}
-        lanes.update(snapshot.lane_counts.keys())
-        lanes.update(snapshot.totals.keys())
-        for lane in lanes:
-            if lane is None:
-                continue
-            previous_total = self._lane_totals.get(lane, 0)
-            current_total = max(snapshot.totals.get(lane, previous_total), 0)
-            previous_timestamp = self._lane_total_timestamp.get(lane, snapshot.timestamp)
-            delta_seconds = max((snapshot.timestamp - previous_timestamp).total_seconds(), 0.0)
-            delta_total = max(current_total - previous_total, 0)
-            last_activity = self._lane_last_activity.get(lane)
-            if last_activity is None:
-                last_activity = snapshot.timestamp
-            if current_total < previous_total:
-                last_activity = snapshot.timestamp
-                gap_seconds = 0.0
-            elif current_total > previous_total:
-                last_activity = snapshot.timestamp
+        timestamp = snapshot.timestamp.timestamp()
+        # re-applying the same frame is a no-op (zero elapsed time, same totals)
+        frame = (snapshot.frame_id, timestamp)
+        if frame == self._last_processed_frame:
+            return
+        self._last_processed_frame = frame
+        self._state_version += 1
+        # _latest_snapshot registers the snapshot's counted lanes first, so only
+        # totals-only lanes need to be visited on top of the registered ones
+        registered = self.state_store.lane_ids_view()
+        extra_lanes = [
+            lane for lane in snapshot.totals if lane is not None and lane not in registered
+        ]
+        # Per-lane state stays in parallel dicts keyed by lane (a junction has a
+        # handful of lanes); bind them and the loop invariants once up front.
+        lane_totals = self._lane_totals
+        lane_last_activity = self._lane_last_activity
+        lane_gaps = self._lane_gaps
+        lane_total_timestamp = self._lane_total_timestamp
+        lane_arrival_rate = self._lane_arrival_rate
+        lane_forecast = self._lane_forecast
+        snapshot_totals = snapshot.totals
+        forecasting = self.forecast_horizon > 0
+        horizon = self.forecast_horizon
+        alpha = self.forecast_smoothing
+        prior_weight = 1.0 - alpha
+        # clamps are inline comparisons rather than max() calls, which cost a
+        # builtin call (and argument tuple) each time in CPython
+        for lane in chain(registered, extra_lanes):
+            previous_total = lane_totals.get(lane, 0)
+            current_total = snapshot_totals.get(lane, previous_total)
+            if current_total < 0:
+                current_total = 0
+            # only ever compared against zero, so no clamp needed
+            delta_seconds = timestamp - lane_total_timestamp.get(lane, timestamp)
+            # any change in the running total (including a counter reset) is activity
+            if current_total != previous_total:
+                lane_last_activity[lane] = timestamp
                 gap_seconds = 0.0
             else:
-                gap_seconds = max(0.0, (snapshot.timestamp - last_activity).total_seconds())
-            self._lane_totals[lane] = current_total
-            self._lane_last_activity[lane] = last_activity
-            self._lane_gaps[lane] = gap_seconds
-            if self.forecast_horizon > 0 and delta_seconds > 0:
-                observed_rate = delta_total / delta_seconds if delta_seconds else 0.0
-                prior_rate = self._lane_arrival_rate.get(lane, observed_rate)
-                alpha = self.forecast_smoothing
-                blended_rate = alpha * observed_rate + (1.0 - alpha) * prior_rate
-                self._lane_arrival_rate[lane] = blended_rate
-                self._lane_forecast[lane] = blended_rate * self.forecast_horizon
-            elif lane not in self._lane_forecast:
-                self._lane_forecast[lane] = 0.0
-            self._lane_total_timestamp[lane] = snapshot.timestamp
+                gap_seconds = timestamp - lane_last_activity.setdefault(lane, timestamp)
+                if gap_seconds < 0.0:
+                    gap_seconds = 0.0
+            lane_totals[lane] = current_total
+            lane_gaps[lane] = gap_seconds
+            if forecasting and delta_seconds > 0:
+                observed_rate = (
+                    (current_total - previous_total) / delta_seconds
+                    if current_total > previous_total
+                    else 0.0
+                )
+                prior_rate = lane_arrival_rate.get(lane, observed_rate)
+                blended_rate = alpha * observed_rate + prior_weight * prior_rate
+                lane_arrival_rate[lane] = blended_rate
+                lane_forecast[lane] = blended_rate * horizon
+            elif lane not in lane_forecast:
+                lane_forecast[lane] = 0.0
+            lane_total_timestamp[lane] = timestamp
 
     def _resolve_mode(self) -> str:
-        lane_count = len(self.state_store.lanes())
+        lane_count = self.state_store.lane_count()
         if lane_count <= 1:
             return "single_flow"
         if lane_count == 2:
@@ -127,75 +235,136 @@ class SignalService:
             vehicle_gaps=self._lane_gaps,
             forecasts=self._lane_forecast,
         )
-        priorities = {item.lane: item for item in breakdowns}
-        decision = self.scheduler.next_cycle(priorities, now)
+        decision = self.scheduler.next_cycle(breakdowns, now)
         self.state_store.mark_green(decision.green_lane, now)
         self._active_decision = decision
         self._last_priorities = breakdowns
-        self._history.append(decision)
-        self.persistence.append_history([decision])
-        self.persistence.save_state(self.snapshot(now))
+        self._prediction_cache = None
+        self._state_version += 1
+        self._record_history(decision)
+        # the state version just changed, so the snapshot is always new here
+        self.persistence.commit([decision], self.snapshot(now))
+        self._persisted_state_version = self._state_version
         return decision
 
+    def _record_history(self, decision: CycleDecision) -> None:
+        history = self._history
+        if len(history) == history.maxlen:
+            self._account_history(history[0], -1)
+        history.append(decision)
+        self._account_history(decision, 1)
+        self._cycles_executed += 1
+
+    def _account_history(self, decision: CycleDecision, sign: int) -> None:
+        wait_totals = self._wait_totals
+        wait_counts = self._wait_counts
+        for entry in decision.priorities:
+            lane = entry.lane
+            count = wait_counts.get(lane, 0) + sign
+            if count > 0:
+                wait_counts[lane] = count
+                wait_totals[lane] = wait_totals.get(lane, 0.0) + sign * entry.waiting_time
+            else:
+                wait_counts.pop(lane, None)
+                wait_totals.pop(lane, None)
+        self._green_total += sign * decision.green_duration
+
     def step(self, now: datetime) -> Optional[CycleDecision]:
         self._apply_tick(now)
         if self._active_decision and now < self._active_decision.effective_until:
-            self.persistence.save_state(self.snapshot(now))
+            self._save_state(now)
             return None
         return self.evaluate_cycle(now, apply_tick=False)
 
+    def _save_state(self, now: Optional[datetime] = None, *, hydrate: bool = True) -> None:
+        # only write when the frame or lane state changed since the last save;
+        # idle worker ticks on an unchanged frame skip the write
+        status = self.snapshot(now, hydrate=hydrate)
+        if self._state_version == self._persisted_state_version:
+            return
+        self.persistence.save_state(status)
+        self._persisted_state_version = self._state_version
+
     def snapshot(self, now: Optional[datetime] = None, *, hydrate: bool = True) -> dict:
+        """Return the current status payload.
+
+        The result is cached per state version and SNAPSHOT_RESOLUTION_SECONDS
+        window and shared between callers, so it must not be mutated. The
+        per-lane maps are live read-only views; copy them to keep a point-in-time
+        record.
+        """
         reference_time = now or datetime.now(timezone.utc)
         if self._last_snapshot is None and hydrate:
             try:
                 self._latest_snapshot()
             except RuntimeError:
                 pass
+        key = (
+            self._state_version,
+            int(reference_time.timestamp() // SNAPSHOT_RESOLUTION_SECONDS),
+        )
+        if self._snapshot_cache is not None and self._snapshot_cache[0] == key:
+            return self._snapshot_cache[1]
         remaining = 0.0
         if self._active_decision:
             remaining = max(
                 0.0,
                 (self._active_decision.effective_until - reference_time).total_seconds(),
             )
-        lane_counts = self._last_snapshot.lane_counts if self._last_snapshot else {}
-        signal_states = self._last_snapshot.signal_states if self._last_snapshot else {}
-        metadata_attr = getattr(self.ingestor, "metadata", {})
-        metadata = metadata_attr() if callable(metadata_attr) else metadata_attr or {}
-        junction_type = (
-            self._last_snapshot.junction_type
-            if self._last_snapshot
-            else metadata.get("junction_type")
-        )
-        return {
+        if self._frame_fields is not None:
+            lane_counts, signal_states, junction_type = self._frame_fields
+        else:
+            lane_counts, signal_states = {}, {}
+            junction_type = self._fallback_junction_type()
+        status = {
             "current_green": self._active_decision.green_lane if self._active_decision else None,
             "remaining_seconds": remaining,
             "cycle_id": self._active_decision.cycle_id if self._active_decision else None,
             "cycle_started_at": self.state_store.current_green_started_at,
             "last_updated": reference_time,
             "lane_counts": lane_counts,
-            "lane_totals": dict(self._lane_totals),
-            "lane_wait_times": self.state_store.waiting_times(),
-            "lane_gaps": dict(self._lane_gaps),
-            "lane_forecasts": dict(self._lane_forecast),
+            "lane_totals": self._lane_totals_view,
+            "lane_wait_times": self.state_store.waiting_times_view(),
+            "lane_gaps": self._lane_gaps_view,
+            "lane_forecasts": self._lane_forecast_view,
             "signal_states": signal_states,
             "junction_type": junction_type,
             "directions": self.state_store.lanes(),
             "mode": self._resolve_mode(),
         }
+        self._snapshot_cache = (key, status)
+        return status
+
+    def _fallback_junction_type(self) -> Optional[str]:
+        # ingestors without metadata_version (e.g. replay) have fixed metadata
+        version = getattr(self.ingestor, "metadata_version", None)
+        cached = self._junction_type_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        metadata_attr = getattr(self.ingestor, "metadata", {})
+        metadata = metadata_attr() if callable(metadata_attr) else metadata_attr or {}
+        junction_type = metadata.get("junction_type")
+        self._junction_type_cache = (version, junction_type)
+        return junction_type
+
+    def wait_times_view(self) -> Mapping[str, float]:
+        """Current per-lane waits without building a full snapshot."""
+        return self.state_store.waiting_times_view()
 
     def predict_next(self) -> Optional[PriorityBreakdown]:
         if not self._last_priorities:
             return None
-        ordered = sorted(
-            self._last_priorities,
-            key=lambda item: (item.score, item.waiting_time, item.vehicle_count),
-            reverse=True,
-        )
+        cycle_id = self._active_decision.cycle_id if self._active_decision else None
+        cached = self._prediction_cache
+        if cached is not None and cached[0] == cycle_id:
+            return cached[1]
+        # lanes are unique, so the best lane other than the current green is
+        # always among the top two
         current_lane = self._active_decision.green_lane if self._active_decision else None
-        for item in ordered:
-            if item.lane != current_lane:
-                return item
-        return ordered[0]
+        top_two = select_top_two(self._last_priorities)
+        prediction = next((item for item in top_two if item.lane != current_lane), top_two[0])
+        self._prediction_cache = (cycle_id, prediction)
+        return prediction
 
     def history(self, limit: Optional[int] = None) -> List[CycleDecision]:
         items = list(self._history)
@@ -205,20 +374,28 @@ class SignalService:
 
     def reset(self) -> None:
         self.state_store.reset()
-        self._last_tick_at = None
+        self._last_tick_ts = None
         self._active_decision = None
         self._last_priorities = []
+        self._prediction_cache = None
         self._last_snapshot = None
+        self._frame_fields = None
         self._history.clear()
+        self._wait_totals.clear()
+        self._wait_counts.clear()
+        self._green_total = 0.0
+        self._cycles_executed = 0
         self._lane_totals.clear()
         self._lane_last_activity.clear()
         self._lane_gaps.clear()
         self._lane_total_timestamp.clear()
         self._lane_arrival_rate.clear()
         self._lane_forecast.clear()
+        self._last_processed_frame = None
         self._stale_incidents = 0
+        self._state_version += 1
         self.persistence.clear_history()
-        self.persistence.save_state(self.snapshot(hydrate=False))
+        self._save_state(hydrate=False)
 
     def current_decision(self) -> Optional[CycleDecision]:
         return self._active_decision
@@ -229,7 +406,7 @@ class SignalService:
     def _assert_snapshot_fresh(self, snapshot: LaneSnapshot, now: datetime) -> None:
         if self.telemetry_stale_after <= 0:
             return
-        age_seconds = (now - snapshot.timestamp).total_seconds()
+        age_seconds = now.timestamp() - snapshot.timestamp.timestamp()
         if age_seconds > self.telemetry_stale_after:
             logger.warning(
                 "Telemetry snapshot is stale (age=%.1fs, limit=%.1fs)",
@@ -240,30 +417,23 @@ class SignalService:
             raise RuntimeError("Telemetry snapshot is stale")
 
     def metrics(self) -> dict:
-        wait_totals: Dict[str, float] = defaultdict(float)
-        wait_counts: Dict[str, int] = defaultdict(int)
-        for decision in self._history:
-            for entry in decision.priorities:
-                wait_totals[entry.lane] += entry.waiting_time
-                wait_counts[entry.lane] += 1
-        average_wait = {
-            lane: (wait_totals[lane] / wait_counts[lane]) if wait_counts[lane] else 0.0
-            for lane in wait_totals
-        }
-        average_green = (
-            mean(decision.green_duration for decision in self._history)
-            if self._history
-            else 0.0
-        )
-        status = self.snapshot(hydrate=False)
+        """Return aggregate cycle metrics.
+
+        Like snapshot(), the per-lane current maps are live read-only views.
+        """
+        # averages cover the decisions still held in history; cycles_executed is the lifetime count
+        wait_totals = self._wait_totals
+        average_wait = {lane: wait_totals[lane] / count for lane, count in self._wait_counts.items()}
+        retained = len(self._history)
+        average_green = self._green_total / retained if retained else 0.0
         return {
-            "cycles_executed": len(self._history),
+            "cycles_executed": self._cycles_executed,
             "average_green_duration": average_green,
             "average_wait_by_lane": average_wait,
-            "current_wait_by_lane": status.get("lane_wait_times", {}),
-            "lane_forecasts": dict(self._lane_forecast),
+            "current_wait_by_lane": self.state_store.waiting_times_view(),
+            "lane_forecasts": self._lane_forecast_view,
             "stale_incidents": self._stale_incidents,
             "forecast_horizon": self.forecast_horizon,
             "telemetry_stale_after": self.telemetry_stale_after,
-            "last_updated": status.get("last_updated"),
+            "last_updated": datetime.now(timezone.utc),
         }
@@ -89,3 +89,50 @@ def test_api_status_endpoint(monkeypatch, tmp_path) -> None:
 
         reset_response = client.post("/signal/reset")
         assert reset_response.status_code == 204
+
+
+def test_upload_history_writes_are_coalesced(monkeypatch, tmp_path) -> None:
+    history_file = tmp_path / "upload_history.json"
+    monkeypatch.setenv("TRAFFIC_ENABLE_BACKGROUND_WORKER", "0")
+    main = _reload_main()
+    monkeypatch.setattr(main, "UPLOAD_HISTORY_FILE", history_file)
+
+    main.add_upload_record({"id": "run-1", "status": "processing"})
+    main.update_upload_status("run-1", "completed", "done")
+    assert not history_file.exists()
+    assert main.load_upload_history()[0]["status"] == "completed"
+
+    main.flush_upload_history()
+    persisted = json.loads(history_file.read_text())
+    assert persisted == [{"id": "run-1", "status": "completed", "notes": "done"}]
+    assert not history_file.with_suffix(".json.tmp").exists()
+
+
+def test_upload_history_picks_up_external_writes(monkeypatch, tmp_path) -> None:
+    history_file = tmp_path / "upload_history.json"
+    monkeypatch.setenv("TRAFFIC_ENABLE_BACKGROUND_WORKER", "0")
+    main = _reload_main()
+    monkeypatch.setattr(main, "UPLOAD_HISTORY_FILE", history_file)
+
+    main.add_upload_record({"id": "run-1", "status": "completed"})
+    main.flush_upload_history()
+
+    history_file.write_text(json.dumps([{"id": "run-2", "status": "pending"}, {"id": "run-1", "status": "completed"}]))
+    assert [record["id"] for record in main.load_upload_history()] == ["run-2", "run-1"]
+
+    main.update_upload_status("missing", "failed")
+    assert not main._upload_history_dirty.is_set()
+
+
+def test_operational_context_follows_external_upload_history_writes(monkeypatch, tmp_path) -> None:
+    history_file = tmp_path / "upload_history.json"
+    monkeypatch.setenv("TRAFFIC_ENABLE_BACKGROUND_WORKER", "0")
+    main = _reload_main()
+    monkeypatch.setattr(main, "UPLOAD_HISTORY_FILE", history_file)
+
+    history_file.write_text(json.dumps([{"id": "run-1", "status": "completed", "displayName": "Old"}]))
+    snapshot = {"mode": "live", "directions": ["north", "west"]}
+    assert main.build_operational_context(snapshot)["displayName"] == "Old"
+
+    history_file.write_text(json.dumps([{"id": "run-2", "status": "pending", "displayName": "New run"}]))
+    assert main.build_operational_context(snapshot)["displayName"] == "New run"
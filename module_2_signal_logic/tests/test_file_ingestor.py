@@ -1,7 +1,10 @@
+import asyncio
 import json
+import os
+import time
 from datetime import datetime, timedelta, timezone
 
-from module_2_signal_logic.adapters.file_ingestor import ResultsFileIngestor
+from module_2_signal_logic.adapters.file_ingestor import MTIME_GRANULARITY_NS, ResultsFileIngestor
 
 
 def test_file_ingestor_returns_window(tmp_path) -> None:
@@ -39,3 +42,73 @@ def test_file_ingestor_returns_window(tmp_path) -> None:
     assert snapshots[0].frame_id == 4
     assert snapshots[-1].lane_counts["west"] == 6
     assert snapshots[-1].signal_states["west"] == "red"
+
+
+def test_file_ingestor_reuses_window_until_file_changes(tmp_path, monkeypatch) -> None:
+    source = tmp_path / "results.json"
+    base_time = datetime(2025, 11, 4, tzinfo=timezone.utc)
+    settled_ns = time.time_ns() - 10 * MTIME_GRANULARITY_NS
+
+    def write(frames: int, north_total: int = 0) -> None:
+        records = [
+            {
+                "frame_id": frame,
+                "timestamp": (base_time + timedelta(seconds=frame)).isoformat(),
+                "direction": "north",
+                "counts": {"north": frame},
+                "totals": {"north": north_total or frame},
+            }
+            for frame in range(1, frames + 1)
+        ]
+        source.write_text(json.dumps({"records": records}))
+
+    write(4)
+    # an mtime well in the past: unchanged stats are trusted without a read
+    os.utime(source, ns=(settled_ns, settled_ns))
+    ingestor = ResultsFileIngestor(source, window_size=2)
+    first = ingestor.load_recent()
+
+    reads = []
+    read_bytes = type(source).read_bytes
+    monkeypatch.setattr(type(source), "read_bytes", lambda self: (reads.append(self), read_bytes(self))[1])
+
+    assert ingestor.load_recent() == first
+    assert reads == []
+
+    write(12)
+    snapshots = ingestor.load_recent()
+    assert len(reads) == 1
+    assert [snapshot.frame_id for snapshot in snapshots] == [11, 12]
+    assert snapshots[-1].totals["north"] == 12
+
+    # a same-size, same-inode rewrite inside one mtime tick is caught by content
+    mtime_ns = source.stat().st_mtime_ns
+    write(12, north_total=99)
+    os.utime(source, ns=(mtime_ns, mtime_ns))
+    assert ingestor.load_recent()[-1].totals["north"] == 99
+
+
+def test_file_ingestor_data_ready_follows_running_loop(tmp_path) -> None:
+    ingestor = ResultsFileIngestor(tmp_path / "results.json")
+
+    async def signal_and_wait() -> bool:
+        ingestor.data_ready.set()
+        await asyncio.wait_for(ingestor.data_ready.wait(), timeout=1.0)
+        return ingestor.data_ready.is_set()
+
+    # each asyncio.run uses a new loop, as separate app lifespans would
+    assert asyncio.run(signal_and_wait())
+    assert asyncio.run(signal_and_wait())
+
+
+def test_file_ingestor_watch_returns_once_stopped(tmp_path) -> None:
+    ingestor = ResultsFileIngestor(tmp_path / "results.json")
+
+    async def watch_then_stop() -> None:
+        stop_event = asyncio.Event()
+        watch_task = asyncio.create_task(ingestor.watch(stop_event))
+        await asyncio.sleep(0.1)
+        stop_event.set()
+        await asyncio.wait_for(watch_task, timeout=5.0)
+
+    asyncio.run(watch_then_stop())
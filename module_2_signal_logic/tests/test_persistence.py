@@ -0,0 +1,50 @@
+import json
+from datetime import datetime, timezone
+
+from module_2_signal_logic.adapters.persistence import JsonPersistence
+from module_2_signal_logic.core.models import CycleDecision
+
+
+def _decision(cycle_id: int) -> CycleDecision:
+    decided_at = datetime(2025, 11, 4, 16, 18, tzinfo=timezone.utc)
+    return CycleDecision(
+        cycle_id=cycle_id,
+        decided_at=decided_at,
+        green_lane="north",
+        green_duration=20.0,
+        priorities=[],
+        effective_from=decided_at,
+        effective_until=decided_at,
+    )
+
+
+def test_persistence_moves_unreadable_history_aside(tmp_path) -> None:
+    history_path = tmp_path / "history.json"
+    history_path.write_text('[{"cycle_id": 1}, {"cycle_')
+    persistence = JsonPersistence(history_path, tmp_path / "snapshot.json")
+
+    persistence.append_history([_decision(2)])
+    persistence.close()
+
+    assert (tmp_path / "history.json.corrupt").read_text() == '[{"cycle_id": 1}, {"cycle_'
+    assert [entry["cycle_id"] for entry in json.loads(history_path.read_text())] == [2]
+
+
+def test_persistence_appends_stay_valid_across_instances(tmp_path) -> None:
+    history_path = tmp_path / "history.json"
+    first = JsonPersistence(history_path, tmp_path / "snapshot.json")
+    second = JsonPersistence(history_path, tmp_path / "snapshot.json")
+
+    first.append_history([_decision(1)])
+    second.clear_history()
+    first.append_history([_decision(2)])
+    second.append_history([_decision(3)])
+    first.append_history([_decision(4)])
+    assert [entry["cycle_id"] for entry in json.loads(history_path.read_text())] == [2, 3, 4]
+
+    history_path.write_text("[]\n")
+    first.append_history([_decision(5)])
+    first.close()
+    second.close()
+
+    assert [entry["cycle_id"] for entry in json.loads(history_path.read_text())] == [5]
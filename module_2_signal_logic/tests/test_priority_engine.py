@@ -26,3 +26,19 @@ def test_priority_scores_computed() -> None:
     east_breakdown = next(item for item in breakdowns if item.lane == "east")
     assert top_score > east_breakdown.score
     assert east_breakdown.vehicle_gap == gaps["east"]
+
+
+def test_priority_top_k_matches_full_ordering() -> None:
+    engine = PriorityEngine()
+    snapshot = LaneSnapshot(
+        frame_id=1,
+        timestamp=datetime.now(timezone.utc),
+        lane_counts={"north": 3, "east": 9, "south": 1, "west": 6},
+    )
+    lanes = ["north", "east", "south", "west"]
+    waiting = {"north": 4.0, "east": 1.0, "south": 12.0, "west": 3.0}
+
+    full = engine.score_lanes(lanes, snapshot, waiting, {})
+    top_two = engine.score_lanes(lanes, snapshot, waiting, {}, top_k=2)
+
+    assert [item.lane for item in top_two] == [item.lane for item in full[:2]]
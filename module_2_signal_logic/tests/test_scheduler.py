@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 
 from module_2_signal_logic.core.models import PriorityBreakdown
-from module_2_signal_logic.core.scheduler import SchedulerConfig, SignalScheduler
+from module_2_signal_logic.core.scheduler import SchedulerConfig, SignalScheduler, select_top_two
 
 
 def test_scheduler_respects_bounds() -> None:
@@ -23,3 +23,51 @@ def test_scheduler_respects_bounds() -> None:
     )) * config.scaling_factor
     clamped_expected = max(config.min_green, min(config.max_green, expected_duration))
     assert abs(decision.green_duration - clamped_expected) < 0.01
+
+
+def test_scheduler_partial_order_keeps_decision() -> None:
+    priorities = {
+        "north": PriorityBreakdown(lane="north", vehicle_count=5, waiting_time=12.0, cooldown_penalty=0.0, score=9.0),
+        "west": PriorityBreakdown(lane="west", vehicle_count=12, waiting_time=4.0, cooldown_penalty=0.0, score=9.5),
+        "east": PriorityBreakdown(lane="east", vehicle_count=0, waiting_time=20.0, cooldown_penalty=0.0, score=5.0),
+    }
+    now = datetime.now(timezone.utc)
+
+    full = SignalScheduler().next_cycle(priorities, now)
+    partial = SignalScheduler().next_cycle(priorities, now, full_order=False)
+
+    assert partial.green_lane == full.green_lane
+    assert partial.green_duration == full.green_duration
+    assert [item.lane for item in partial.priorities] == ["north", "west", "east"]
+
+    unsorted = SignalScheduler(SchedulerConfig(sort_priorities=False)).next_cycle(priorities, now)
+    assert unsorted.green_lane == full.green_lane
+    assert [item.lane for item in unsorted.priorities] == ["north", "west", "east"]
+
+
+def test_scheduler_accepts_breakdown_list() -> None:
+    breakdowns = [
+        PriorityBreakdown(lane="north", vehicle_count=5, waiting_time=12.0, cooldown_penalty=0.0, score=9.0),
+        PriorityBreakdown(lane="west", vehicle_count=12, waiting_time=4.0, cooldown_penalty=0.0, score=9.5),
+    ]
+    now = datetime.now(timezone.utc)
+
+    from_list = SignalScheduler().next_cycle(breakdowns, now)
+    from_mapping = SignalScheduler().next_cycle({item.lane: item for item in breakdowns}, now)
+
+    assert from_list.green_lane == from_mapping.green_lane == "west"
+    assert from_list.green_duration == from_mapping.green_duration
+    assert from_list.priorities == from_mapping.priorities
+
+
+def test_select_top_two_keeps_input_order_on_ties() -> None:
+    breakdowns = [
+        PriorityBreakdown(lane="north", vehicle_count=3, waiting_time=5.0, cooldown_penalty=0.0, score=7.0),
+        PriorityBreakdown(lane="east", vehicle_count=1, waiting_time=2.0, cooldown_penalty=0.0, score=4.0),
+        PriorityBreakdown(lane="south", vehicle_count=3, waiting_time=5.0, cooldown_penalty=0.0, score=7.0),
+        PriorityBreakdown(lane="west", vehicle_count=9, waiting_time=1.0, cooldown_penalty=0.0, score=6.0),
+    ]
+
+    assert [item.lane for item in select_top_two(breakdowns)] == ["north", "south"]
+    assert [item.lane for item in select_top_two(breakdowns[1:2])] == ["east"]
+    assert select_top_two([]) == []
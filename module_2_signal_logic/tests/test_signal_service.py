@@ -1,6 +1,8 @@
 import json
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from module_2_signal_logic.adapters.file_ingestor import ResultsFileIngestor
 from module_2_signal_logic.adapters.persistence import JsonPersistence
 from module_2_signal_logic.core.priority_engine import PriorityEngine
@@ -155,3 +157,93 @@ def test_signal_service_metrics_reports_history(tmp_path) -> None:
     assert metrics["cycles_executed"] >= 1
     assert metrics["stale_incidents"] == 0
     assert metrics["average_wait_by_lane"]
+
+
+def _build_service(tmp_path, now, counts, *, history=(), history_fsync_every=16, **service_options):
+    """Write a one-frame results file for `counts` and wire a service over tmp_path."""
+    results_path = tmp_path / "results.json"
+    history_path = tmp_path / "history.json"
+    snapshot_path = tmp_path / "snapshot.json"
+
+    payload = {
+        "records": [
+            {
+                "frame_id": 1,
+                "timestamp": now.isoformat(),
+                "direction": lane,
+                "counts": {lane: count},
+                "totals": {lane: count},
+            }
+            for lane, count in counts.items()
+        ]
+    }
+    results_path.write_text(json.dumps(payload))
+    history_path.write_text(json.dumps(list(history), indent=2))
+
+    state_store = StateStore(list(counts), cooldown_duration=5.0)
+    ingestor = ResultsFileIngestor(results_path, window_size=3)
+    persistence = JsonPersistence(history_path, snapshot_path, history_fsync_every=history_fsync_every)
+    service = SignalService(
+        ingestor, PriorityEngine(), SignalScheduler(), state_store, persistence, **service_options
+    )
+    return service, persistence
+
+
+def test_signal_service_skips_unchanged_state_writes(tmp_path) -> None:
+    now = datetime.now(timezone.utc)
+    service, persistence = _build_service(tmp_path, now, {"north": 4, "west": 2})
+
+    assert service.step(now) is not None
+    saved_states = []
+    save_state = persistence.save_state
+    persistence.save_state = lambda state: (saved_states.append(state), save_state(state))
+
+    assert service.step(now) is None
+    assert saved_states == []
+    assert service.snapshot(now) is service.snapshot(now)
+
+    # an idle tick on the same frame changes only the clock, so nothing is written
+    assert service.step(now + timedelta(seconds=1)) is None
+    assert saved_states == []
+
+    next_cycle_at = service.current_decision().effective_until
+    decision = service.step(next_cycle_at)
+    assert decision is not None
+    assert [state["cycle_id"] for state in saved_states] == [decision.cycle_id]
+
+
+def test_history_appends_keep_file_valid_json(tmp_path) -> None:
+    start = datetime.now(timezone.utc)
+    service, persistence = _build_service(
+        tmp_path, start, {"north": 4, "west": 2}, history=[{"cycle_id": 0}], history_fsync_every=2
+    )
+
+    decisions = [service.evaluate_cycle(start + timedelta(seconds=i)) for i in range(3)]
+    persistence.close()
+
+    reopened = JsonPersistence(persistence.history_path, persistence.state_snapshot_path)
+    reopened.append_history(decisions[-1:])
+    reopened.close()
+
+    history_entries = json.loads(persistence.history_path.read_text())
+    assert [entry["cycle_id"] for entry in history_entries] == [0] + [
+        decision.cycle_id for decision in decisions + decisions[-1:]
+    ]
+
+
+def test_signal_service_metrics_track_bounded_history(tmp_path) -> None:
+    start = datetime.now(timezone.utc)
+    service, _ = _build_service(tmp_path, start, {"north": 7, "west": 3}, history_limit=2)
+
+    decisions = [service.evaluate_cycle(start + timedelta(seconds=5 * i)) for i in range(4)]
+    metrics = service.metrics()
+
+    retained = decisions[-2:]
+    assert service.history() == retained
+    assert metrics["cycles_executed"] == 4
+    assert metrics["average_green_duration"] == pytest.approx(
+        sum(decision.green_duration for decision in retained) / 2
+    )
+    for lane in ("north", "west"):
+        waits = [entry.waiting_time for decision in retained for entry in decision.priorities if entry.lane == lane]
+        assert metrics["average_wait_by_lane"][lane] == pytest.approx(sum(waits) / len(waits))